@@ -0,0 +1,29 @@
+"""add covering (plant_id, date) and (customer_id, date) indexes to tally_sessions
+
+Revision ID: 025_add_session_date_indexes
+Revises: 024_add_classification_order
+Create Date: 2025-02-03 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '025_add_session_date_indexes'
+down_revision = '024_add_classification_order'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tally session list/date endpoints filter by plant or customer and order by date DESC.
+    # (status, date), (plant_id, category) and the user_id indexes on plant_permissions/user_roles
+    # already exist, so only the two missing composites are added here.
+    op.create_index('idx_plant_date', 'tally_sessions', ['plant_id', sa.text('date DESC')], unique=False)
+    op.create_index('idx_customer_date', 'tally_sessions', ['customer_id', sa.text('date DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_customer_date', table_name='tally_sessions')
+    op.drop_index('idx_plant_date', table_name='tally_sessions')
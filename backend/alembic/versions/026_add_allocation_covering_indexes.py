@@ -0,0 +1,58 @@
+"""cover allocation measures in idx_session_classification and add log entry aggregation index
+
+Revision ID: 026_add_allocation_covering_idx
+Revises: 025_add_session_date_indexes
+Create Date: 2025-02-04 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '026_add_allocation_covering_idx'
+down_revision = '025_add_session_date_indexes'
+branch_labels = None
+depends_on = None
+
+ALLOCATION_MEASURES = ['required_bags', 'allocated_bags_tally', 'allocated_bags_dispatcher', 'heads']
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+
+    # INCLUDE columns are only supported on SQL Server and PostgreSQL; SQLite keeps the plain unique index
+    if dialect_name in ('mssql', 'postgresql'):
+        op.drop_index('idx_session_classification', table_name='allocation_details')
+        op.create_index(
+            'idx_session_classification',
+            'allocation_details',
+            ['tally_session_id', 'weight_classification_id'],
+            unique=True,
+            mssql_include=ALLOCATION_MEASURES,
+            postgresql_include=ALLOCATION_MEASURES,
+        )
+
+    op.create_index(
+        'idx_tally_log_session_class_role',
+        'tally_log_entries',
+        ['tally_session_id', 'weight_classification_id', 'role'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+
+    op.drop_index('idx_tally_log_session_class_role', table_name='tally_log_entries')
+
+    if dialect_name in ('mssql', 'postgresql'):
+        op.drop_index('idx_session_classification', table_name='allocation_details')
+        op.create_index(
+            'idx_session_classification',
+            'allocation_details',
+            ['tally_session_id', 'weight_classification_id'],
+            unique=True
+        )
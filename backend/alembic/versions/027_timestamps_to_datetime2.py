@@ -0,0 +1,117 @@
+"""store timestamp columns as naive DATETIME2(3) on SQL Server
+
+Revision ID: 027_timestamps_to_datetime2
+Revises: 026_add_allocation_covering_idx
+Create Date: 2025-02-05 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mssql
+
+
+# revision identifiers, used by Alembic.
+revision = '027_timestamps_to_datetime2'
+down_revision = '026_add_allocation_covering_idx'
+branch_labels = None
+depends_on = None
+
+# (table, column, nullable, has CURRENT_TIMESTAMP default, created timezone-aware)
+# Columns from 001 were plain DATETIME; later tables used DateTime(timezone=True),
+# i.e. DATETIMEOFFSET on SQL Server and TIMESTAMPTZ on PostgreSQL.
+TIMESTAMP_COLUMNS = [
+    ('customers', 'created_at', True, True, False),
+    ('customers', 'updated_at', True, True, False),
+    ('plants', 'created_at', True, True, False),
+    ('plants', 'updated_at', True, True, False),
+    ('weight_classifications', 'created_at', True, True, False),
+    ('weight_classifications', 'updated_at', True, True, False),
+    ('tally_sessions', 'created_at', True, True, False),
+    ('tally_sessions', 'updated_at', True, True, False),
+    ('allocation_details', 'created_at', True, True, False),
+    ('allocation_details', 'updated_at', True, True, False),
+    ('tally_log_entries', 'created_at', False, True, True),
+    ('tally_log_entries', 'transferred_at', True, False, True),
+    ('tally_log_entry_audit', 'edited_at', False, True, True),
+    ('users', 'created_at', True, False, True),
+    ('users', 'updated_at', True, False, True),
+    ('plant_permissions', 'created_at', True, False, True),
+    ('roles', 'created_at', False, False, True),
+    ('roles', 'updated_at', False, False, True),
+    ('permissions', 'created_at', False, False, True),
+    ('role_permissions', 'created_at', False, False, True),
+    ('user_roles', 'created_at', False, False, True),
+]
+
+# SQL Server won't alter the type of an indexed column, so these are dropped and rebuilt around it
+TIMESTAMP_INDEXES = [
+    ('ix_tally_log_entries_created_at', 'tally_log_entries', ['created_at']),
+    ('idx_session_created', 'tally_log_entries', ['tally_session_id', 'created_at']),
+    ('ix_tally_log_entries_transferred_at', 'tally_log_entries', ['transferred_at']),
+    ('ix_tally_log_entry_audit_edited_at', 'tally_log_entry_audit', ['edited_at']),
+    ('idx_entry_edited_at', 'tally_log_entry_audit', ['tally_log_entry_id', 'edited_at']),
+]
+
+
+def _drop_mssql_default(table: str, column: str) -> None:
+    """Drop the (system-named) default constraint on a column; SQL Server won't retype a column that has one."""
+    op.execute(f"""
+        DECLARE @name sysname = (
+            SELECT dc.name FROM sys.default_constraints dc
+            JOIN sys.columns c ON c.object_id = dc.parent_object_id AND c.column_id = dc.parent_column_id
+            WHERE dc.parent_object_id = OBJECT_ID('{table}') AND c.name = '{column}'
+        );
+        IF @name IS NOT NULL EXEC('ALTER TABLE [{table}] DROP CONSTRAINT [' + @name + ']')
+    """)
+
+
+def _retype_mssql(type_for_column) -> None:
+    for name, table, _ in TIMESTAMP_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    for table, column, nullable, has_default, was_tz in TIMESTAMP_COLUMNS:
+        if has_default:
+            _drop_mssql_default(table, column)
+        op.alter_column(table, column, type_=type_for_column(was_tz), nullable=nullable)
+        if has_default:
+            op.execute(f"ALTER TABLE [{table}] ADD DEFAULT CURRENT_TIMESTAMP FOR [{column}]")
+
+    for name, table, columns in TIMESTAMP_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+
+    if dialect_name == 'mssql':
+        # DATETIMEOFFSET -> DATETIME2 keeps the stored local time; values were written as UTC
+        _retype_mssql(lambda was_tz: mssql.DATETIME2(precision=3))
+    elif dialect_name == 'postgresql':
+        # Plain TIMESTAMP columns already match; only the timezone-aware ones change
+        for table, column, nullable, _, was_tz in TIMESTAMP_COLUMNS:
+            if was_tz:
+                op.alter_column(
+                    table, column,
+                    type_=sa.DateTime(timezone=False),
+                    existing_nullable=nullable,
+                    postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                )
+    # SQLite has no distinct timestamp storage types, so there is nothing to change
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+
+    if dialect_name == 'mssql':
+        _retype_mssql(lambda was_tz: mssql.DATETIMEOFFSET() if was_tz else sa.DateTime())
+    elif dialect_name == 'postgresql':
+        for table, column, nullable, _, was_tz in TIMESTAMP_COLUMNS:
+            if was_tz:
+                op.alter_column(
+                    table, column,
+                    type_=sa.DateTime(timezone=True),
+                    existing_nullable=nullable,
+                    postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                )
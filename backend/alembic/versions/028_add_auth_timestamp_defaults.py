@@ -0,0 +1,73 @@
+"""add CURRENT_TIMESTAMP defaults to the auth and RBAC timestamp columns
+
+Revision ID: 028_add_auth_timestamp_defaults
+Revises: 027_timestamps_to_datetime2
+Create Date: 2025-02-06 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '028_add_auth_timestamp_defaults'
+down_revision = '027_timestamps_to_datetime2'
+branch_labels = None
+depends_on = None
+
+# 009/010 created these without a server default; the models filled them in from Python
+AUTH_TIMESTAMP_COLUMNS = {
+    'users': ['created_at', 'updated_at'],
+    'plant_permissions': ['created_at'],
+    'roles': ['created_at', 'updated_at'],
+    'permissions': ['created_at'],
+    'role_permissions': ['created_at'],
+    'user_roles': ['created_at'],
+}
+
+
+def _drop_mssql_default(table: str, column: str) -> None:
+    """Drop the (system-named) default constraint on a column."""
+    op.execute(f"""
+        DECLARE @name sysname = (
+            SELECT dc.name FROM sys.default_constraints dc
+            JOIN sys.columns c ON c.object_id = dc.parent_object_id AND c.column_id = dc.parent_column_id
+            WHERE dc.parent_object_id = OBJECT_ID('{table}') AND c.name = '{column}'
+        );
+        IF @name IS NOT NULL EXEC('ALTER TABLE [{table}] DROP CONSTRAINT [' + @name + ']')
+    """)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+
+    for table, columns in AUTH_TIMESTAMP_COLUMNS.items():
+        if dialect_name == 'mssql':
+            for column in columns:
+                op.execute(f"ALTER TABLE [{table}] ADD DEFAULT CURRENT_TIMESTAMP FOR [{column}]")
+        elif dialect_name == 'sqlite':
+            # SQLite can't change a column default in place, so batch mode rebuilds the table
+            with op.batch_alter_table(table) as batch_op:
+                for column in columns:
+                    batch_op.alter_column(column, server_default=sa.text('(CURRENT_TIMESTAMP)'))
+        else:
+            for column in columns:
+                op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+
+    for table, columns in AUTH_TIMESTAMP_COLUMNS.items():
+        if dialect_name == 'mssql':
+            for column in columns:
+                _drop_mssql_default(table, column)
+        elif dialect_name == 'sqlite':
+            with op.batch_alter_table(table) as batch_op:
+                for column in columns:
+                    batch_op.alter_column(column, server_default=None)
+        else:
+            for column in columns:
+                op.alter_column(table, column, server_default=None)
@@ -47,10 +47,10 @@ def read_allocation_details_by_session(
     
     if has_view_logs:
         # Return full allocation details with progress
-        return [AllocationDetailsResponse.model_validate(alloc) for alloc in allocations]
+        return [AllocationDetailsResponse.from_orm_fast(alloc) for alloc in allocations]
     else:
         # Return minimal details (requirements only, no progress)
-        return [AllocationDetailsMinimalResponse.model_validate(alloc) for alloc in allocations]
+        return [AllocationDetailsMinimalResponse.from_orm_fast(alloc) for alloc in allocations]
 
 
 @router.get("/allocations/{allocation_id}")
@@ -78,10 +78,10 @@ def read_allocation_detail(
     
     if has_view_logs:
         # Return full allocation details with progress
-        return AllocationDetailsResponse.model_validate(allocation)
+        return AllocationDetailsResponse.from_orm_fast(allocation)
     else:
         # Return minimal details (requirements only, no progress)
-        return AllocationDetailsMinimalResponse.model_validate(allocation)
+        return AllocationDetailsMinimalResponse.from_orm_fast(allocation)
 
 
 @router.post("/tally-sessions/{session_id}/allocations", response_model=AllocationDetailsResponse, status_code=status.HTTP_201_CREATED)
@@ -12,7 +12,7 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=Token)
-async def login(
+def login(
     login_data: UserLogin,
     db: Session = Depends(get_db)
 ):
@@ -49,7 +49,7 @@ async def login(
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(
+def get_current_user_info(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -95,7 +95,7 @@ async def get_current_user_info(
 
 
 @router.put("/me/preferences", response_model=UserResponse)
-async def update_user_preferences(
+def update_user_preferences(
     preferences: UserPreferencesUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Tuple
 from pydantic import BaseModel
@@ -26,7 +27,6 @@ from ...crud import (
     allocation_details as allocation_details_crud,
 )
 from ...schemas.plant import PlantCreate
-from ...schemas.weight_classification import WeightClassificationCreate
 from ...schemas.customer import CustomerCreate
 from ...schemas.tally_session import TallySessionCreate
 from ...schemas.allocation_details import AllocationDetailsCreate
@@ -70,12 +70,7 @@ BYPRODUCT_CLASSIFICATIONS = [
 def seed_plant_with_classifications(db: Session, plant_name: str) -> Tuple[Plant, bool, int, int, int]:
     """Create a plant with standard weight classifications."""
     # Check if plant already exists
-    all_plants = plant_crud.get_plants(db, skip=0, limit=1000)
-    existing_plant = None
-    for plant in all_plants:
-        if plant.name == plant_name:
-            existing_plant = plant
-            break
+    existing_plant = plant_crud.get_plant_by_name(db, plant_name)
     
     if existing_plant:
         plant = existing_plant
@@ -85,73 +80,45 @@ def seed_plant_with_classifications(db: Session, plant_name: str) -> Tuple[Plant
         plant = plant_crud.create_plant(db, PlantCreate(name=plant_name))
         created = True
     
-    # Get existing weight classifications
-    existing_wcs = weight_classification_crud.get_weight_classifications_by_plant(db, plant.id)
-    existing_classifications = {wc.classification for wc in existing_wcs}
+    # Load the (category, classification) pairs this plant already has in one query
+    existing_pairs = set(
+        db.query(WeightClassification.category, WeightClassification.classification)
+        .filter(WeightClassification.plant_id == plant.id)
+        .all()
+    )
     
-    created_dressed = 0
-    created_frozen = 0
-    created_byproduct = 0
-    
-    # Create Dressed classifications
-    for dc in DRESSED_CLASSIFICATIONS:
-        if dc["classification"] not in existing_classifications:
-            try:
-                weight_classification_crud.create_weight_classification(
-                    db,
-                    WeightClassificationCreate(
-                        plant_id=plant.id,
-                        classification=dc["classification"],
-                        min_weight=dc["min_weight"],
-                        max_weight=dc["max_weight"],
-                        description=dc["description"],
-                        category="Dressed"
-                    )
-                )
-                created_dressed += 1
-            except Exception as e:
-                raise ValueError(f"Failed to create Dressed classification {dc['classification']}: {str(e)}")
+    # Build all missing rows up front; Frozen mirrors the Dressed ranges
+    rows = []
+    for category in ("Dressed", "Frozen"):
+        for dc in DRESSED_CLASSIFICATIONS:
+            if (category, dc["classification"]) not in existing_pairs:
+                rows.append({
+                    "plant_id": plant.id,
+                    "classification": dc["classification"],
+                    "min_weight": dc["min_weight"],
+                    "max_weight": dc["max_weight"],
+                    "description": dc["description"],
+                    "category": category,
+                })
+    for bp in BYPRODUCT_CLASSIFICATIONS:
+        if ("Byproduct", bp["classification"]) not in existing_pairs:
+            rows.append({
+                "plant_id": plant.id,
+                "classification": bp["classification"],
+                "min_weight": None,
+                "max_weight": None,
+                "description": bp["description"],
+                "category": "Byproduct",
+            })
     
-    # Create Frozen classifications (same as Dressed)
-    # Check existing classifications by category to avoid duplicates
-    existing_frozen = {wc.classification for wc in existing_wcs if wc.category == "Frozen"}
-    for dc in DRESSED_CLASSIFICATIONS:
-        if dc["classification"] not in existing_frozen:
-            try:
-                weight_classification_crud.create_weight_classification(
-                    db,
-                    WeightClassificationCreate(
-                        plant_id=plant.id,
-                        classification=dc["classification"],
-                        min_weight=dc["min_weight"],
-                        max_weight=dc["max_weight"],
-                        description=dc["description"],
-                        category="Frozen"
-                    )
-                )
-                created_frozen += 1
-            except Exception as e:
-                # Skip if it fails (e.g., overlap), but don't raise
-                pass
+    created_dressed = sum(1 for row in rows if row["category"] == "Dressed")
+    created_frozen = sum(1 for row in rows if row["category"] == "Frozen")
+    created_byproduct = sum(1 for row in rows if row["category"] == "Byproduct")
     
-    # Create Byproduct classifications
-    for bp in BYPRODUCT_CLASSIFICATIONS:
-        if bp["classification"] not in existing_classifications:
-            try:
-                weight_classification_crud.create_weight_classification(
-                    db,
-                    WeightClassificationCreate(
-                        plant_id=plant.id,
-                        classification=bp["classification"],
-                        description=bp["description"],
-                        min_weight=None,
-                        max_weight=None,
-                        category="Byproduct"
-                    )
-                )
-                created_byproduct += 1
-            except Exception as e:
-                raise ValueError(f"Failed to create Byproduct classification {bp['classification']}: {str(e)}")
+    # The standard ranges don't overlap, so they go in as one multi-row INSERT and one commit
+    if rows:
+        db.execute(insert(WeightClassification), rows)
+    db.commit()
     
     return plant, created, created_dressed, created_frozen, created_byproduct
 
@@ -164,12 +131,7 @@ def populate_test_sessions_for_plant(
 ) -> Dict[str, Any]:
     """Create test customers, tally sessions, and allocations for a plant."""
     # Find the plant
-    all_plants = plant_crud.get_plants(db, skip=0, limit=1000)
-    plant = None
-    for p in all_plants:
-        if p.name == plant_name:
-            plant = p
-            break
+    plant = plant_crud.get_plant_by_name(db, plant_name)
     
     if not plant:
         raise ValueError(f"Plant '{plant_name}' not found. Please create it first using 'setup_plant {plant_name}'")
@@ -204,7 +166,7 @@ def populate_test_sessions_for_plant(
         existing_names.add(customer_name)
         
         try:
-            customer = customer_crud.create_customer(db, CustomerCreate(name=customer_name))
+            customer = customer_crud.create_customer(db, CustomerCreate(name=customer_name), commit=False)
             customers.append(customer)
         except Exception as e:
             raise ValueError(f"Failed to create customer '{customer_name}': {str(e)}")
@@ -231,13 +193,15 @@ def populate_test_sessions_for_plant(
                         plant_id=plant.id,
                         date=session_date,
                         status=status
-                    )
+                    ),
+                    commit=False
                 )
                 sessions.append(session)
             except Exception as e:
                 raise ValueError(f"Failed to create tally session: {str(e)}")
     
-    # Generate allocations
+    # Generate allocations (sessions are new and each picks distinct classifications,
+    # so there are no duplicates and they can be bulk inserted)
     allocations = []
     for session in sessions:
         selected_wcs = []
@@ -269,34 +233,34 @@ def populate_test_sessions_for_plant(
         # Create allocations for selected classifications
         for wc in selected_wcs:
             required_bags = random.choice(valid_bag_counts)
-            
-            try:
-                allocation = allocation_details_crud.create_allocation_detail(
-                    db,
-                    AllocationDetailsCreate(
-                        tally_session_id=session.id,
-                        weight_classification_id=wc.id,
-                        required_bags=float(required_bags),
-                        allocated_bags_tally=0.0,
-                        allocated_bags_dispatcher=0.0,
-                        heads=0.0
-                    )
+            allocations.append(
+                AllocationDetailsCreate(
+                    tally_session_id=session.id,
+                    weight_classification_id=wc.id,
+                    required_bags=float(required_bags),
+                    allocated_bags_tally=0.0,
+                    allocated_bags_dispatcher=0.0,
+                    heads=0.0
                 )
-                allocations.append(allocation)
-            except Exception as e:
-                # Allocation might already exist (unique constraint)
-                if "already exists" not in str(e).lower():
-                    raise ValueError(f"Failed to create allocation: {str(e)}")
+            )
+    
+    try:
+        allocations_created = allocation_details_crud.create_allocation_details_bulk(db, allocations)
+    except Exception as e:
+        raise ValueError(f"Failed to create allocations: {str(e)}")
+    
+    # Commit customers, sessions and allocations in a single transaction
+    db.commit()
     
     return {
         "customers_created": len(customers),
         "sessions_created": len(sessions),
-        "allocations_created": len(allocations)
+        "allocations_created": allocations_created
     }
 
 
 @router.post("/console", response_model=ConsoleCommandResponse)
-async def execute_console_command(
+def execute_console_command(
     request: ConsoleCommandRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_superadmin)
@@ -417,6 +381,7 @@ async def execute_console_command(
                 }
             )
         except ValueError as e:
+            db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
@@ -479,6 +444,7 @@ async def execute_console_command(
                 data=result
             )
         except ValueError as e:
+            db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
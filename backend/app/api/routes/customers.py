@@ -18,8 +18,7 @@ def read_customers(
     current_user: User = Depends(get_current_user)
 ):
     """Get all customers. All authenticated users can see customers."""
-    customers = crud.get_customers(db, skip=skip, limit=limit)
-    return customers
+    return [CustomerResponse.from_orm_fast(c) for c in crud.get_customers(db, skip=skip, limit=limit)]
 
 
 @router.get("/customers/{customer_id}", response_model=CustomerResponse)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func, case
 from typing import List, Dict, Optional, Tuple
@@ -131,12 +132,16 @@ def export_sessions_data(
     response_customers = list(customers_map.values())
     response_customers.sort(key=lambda x: x.customer_name.lower())
 
-    return ExportResponse(
+    # Return the serialized payload directly: response_model only documents the shape here,
+    # so FastAPI doesn't dump and re-validate the already-built model.
+    # model_dump_json() serializes straight to JSON bytes in one pydantic-core pass
+    response = ExportResponse(
         customers=response_customers,
         grand_total_dc=grand_total_dc,
         grand_total_bp=grand_total_bp,
         grand_total_fr=grand_total_fr
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 def process_sessions_for_customer(
@@ -161,7 +166,7 @@ def process_sessions_for_customer(
     entries = db.query(TallyLogEntry).join(WeightClassification).filter(
         TallyLogEntry.tally_session_id.in_(session_ids),
         TallyLogEntry.role == role
-    ).order_by(TallyLogEntry.created_at.asc()).all()
+    ).order_by(TallyLogEntry.created_at.asc(), TallyLogEntry.id.asc()).all()
     
     if not entries:
         raise HTTPException(status_code=404, detail="No tally entries found for the specified sessions")
@@ -354,7 +359,9 @@ def process_sessions_for_customer(
                         cell_value = entry.weight
                     
                     grid[row_idx][current_column] = cell_value
-                    sheet_entries.append(TallySheetEntry(
+                    # One entry per tallied bag: values are already typed (ints/ORM floats),
+                    # so skip per-entry validation
+                    sheet_entries.append(TallySheetEntry.model_construct(
                         row=row_idx + 1,  # 1-indexed
                         column=current_column,
                         weight=entry.weight,
@@ -392,10 +399,10 @@ def process_sessions_for_customer(
                 ))
         
         # Calculate summaries for this page
-        # Get all classifications present on this page
-        page_classifications = set()
+        # Group this page's entries by classification in one pass
+        page_entries_by_classification: Dict[Tuple[int, str], List[TallyLogEntry]] = defaultdict(list)
         for entry, wc_id, classification in page_entries:
-            page_classifications.add((wc_id, classification))
+            page_entries_by_classification[(wc_id, classification)].append(entry)
         
         # Calculate summaries per classification - only include relevant category
         summary_dressed: List[TallySheetSummary] = []
@@ -412,19 +419,15 @@ def process_sessions_for_customer(
         total_byproduct_heads = 0.0
         total_byproduct_kilograms = 0.0
         
-        for wc_id, classification in sorted(page_classifications, key=get_classification_sort_key):
+        for wc_id, classification in sorted(page_entries_by_classification, key=get_classification_sort_key):
             wc = weight_classifications[wc_id]
-            # Count entries for this classification on this page
-            page_entries_for_wc = [
-                (e, e_wc_id, cls) for e, e_wc_id, cls in page_entries
-                if e_wc_id == wc_id and cls == classification
-            ]
+            page_entries_for_wc = page_entries_by_classification[(wc_id, classification)]
             
             bags = len(page_entries_for_wc)
             # For both byproduct and dressed/frozen, use actual heads from entries with fallback to weight classification's default_heads
             default_heads = wc.default_heads if wc.default_heads is not None else FALLBACK_DEFAULT_HEADS
-            heads = sum(e.heads if e.heads is not None else default_heads for e, _, _ in page_entries_for_wc)
-            kilograms = sum(e.weight for e, _, _ in page_entries_for_wc)
+            heads = sum(e.heads if e.heads is not None else default_heads for e in page_entries_for_wc)
+            kilograms = sum(e.weight for e in page_entries_for_wc)
             
             summary = TallySheetSummary(
                 classification=classification,
@@ -586,4 +589,6 @@ def export_tally_sheet(
     # Sort customers alphabetically by name
     customer_responses.sort(key=lambda x: x.customer_name.lower())
     
-    return TallySheetMultiCustomerResponse(customers=customer_responses)
+    # Skip FastAPI's dump/re-validate round trip of the (large) tally sheet grids
+    response = TallySheetMultiCustomerResponse(customers=customer_responses)
+    return Response(content=response.model_dump_json(), media_type="application/json")
@@ -11,7 +11,7 @@ router = APIRouter()
 
 
 @router.get("", response_model=List[PermissionResponse])
-async def list_permissions(
+def list_permissions(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
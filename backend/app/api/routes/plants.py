@@ -19,7 +19,7 @@ def read_plants(
     accessible_plant_ids: List[int] = Depends(get_user_accessible_plant_ids)
 ):
     """Get plants. Superadmins see all, regular admins see only their assigned plants."""
-    plants = crud.get_plants(db, skip=skip, limit=limit)
+    plants = [PlantResponse.from_orm_fast(p) for p in crud.get_plants(db, skip=skip, limit=limit)]
     
     # Filter by accessible plants for non-superadmins
     if not user_has_role(current_user, 'SUPERADMIN'):
@@ -19,7 +19,7 @@ router = APIRouter()
 
 
 @router.post("", response_model=RoleResponse, status_code=status.HTTP_201_CREATED)
-async def create_role(
+def create_role(
     role_data: RoleCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("can_manage_roles"))
@@ -51,7 +51,7 @@ async def create_role(
 
 
 @router.get("", response_model=List[RoleResponse])
-async def list_roles(
+def list_roles(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -65,7 +65,7 @@ async def list_roles(
 
 
 @router.get("/{role_id}", response_model=RoleWithPermissions)
-async def get_role(
+def get_role(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -83,7 +83,7 @@ async def get_role(
     
     # Convert permissions to response format
     permissions_response = [
-        PermissionResponse.model_validate(perm) for perm in role.permissions
+        PermissionResponse.from_orm_fast(perm) for perm in role.permissions
     ]
     
     return RoleWithPermissions(
@@ -98,7 +98,7 @@ async def get_role(
 
 
 @router.put("/{role_id}", response_model=RoleResponse)
-async def update_role(
+def update_role(
     role_id: int,
     role_data: RoleUpdate,
     db: Session = Depends(get_db),
@@ -155,7 +155,7 @@ async def update_role(
 
 
 @router.delete("/{role_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_role(
+def delete_role(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("can_delete_roles"))
@@ -200,7 +200,7 @@ async def delete_role(
 
 
 @router.post("/{role_id}/permissions", status_code=status.HTTP_200_OK)
-async def assign_permissions(
+def assign_permissions(
     role_id: int,
     request: AssignPermissionsRequest,
     db: Session = Depends(get_db),
@@ -225,9 +225,9 @@ async def assign_permissions(
         )
     
     # Validate all permission IDs exist
+    existing_ids = permission_crud.get_existing_permission_ids(db, request.permission_ids)
     for permission_id in request.permission_ids:
-        permission = permission_crud.get_permission_by_id(db, permission_id)
-        if not permission:
+        if permission_id not in existing_ids:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Permission ID {permission_id} does not exist"
@@ -246,7 +246,7 @@ async def assign_permissions(
 
 
 @router.delete("/{role_id}/permissions/{permission_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_permission(
+def remove_permission(
     role_id: int,
     permission_id: int,
     db: Session = Depends(get_db),
@@ -43,12 +43,14 @@ def read_tally_session_dates(
     customer_id: Optional[int] = Query(None),
     plant_id: Optional[int] = Query(None),
     status: Optional[str] = Query(None),
+    since: Optional[date] = Query(None, description="Only return dates on or after this date"),
+    limit: int = Query(365, ge=1, le=3650, description="Maximum number of most recent dates to return"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     accessible_plant_ids: List[int] = Depends(get_user_accessible_plant_ids)
 ):
     """Get distinct dates that have tally sessions. Users only see dates for sessions in plants they have access to.
-    Returns a list of ISO date strings (YYYY-MM-DD format)."""
+    Returns a list of ISO date strings (YYYY-MM-DD format), most recent first, bounded by since/limit."""
     # Determine which plant IDs to filter by
     plant_ids_to_filter = None
     if not user_has_role(current_user, 'SUPERADMIN'):
@@ -60,7 +62,9 @@ def read_tally_session_dates(
         customer_id=customer_id,
         plant_id=plant_id,
         status=status,
-        accessible_plant_ids=plant_ids_to_filter
+        accessible_plant_ids=plant_ids_to_filter,
+        since=since,
+        limit=limit
     )
     
     # Convert date objects to ISO format strings (YYYY-MM-DD)
@@ -12,7 +12,7 @@ router = APIRouter()
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def create_user(
+def create_user(
     user_data: UserCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_any_permission(["can_manage_users", "can_assign_admin_roles"]))
@@ -70,7 +70,7 @@ async def create_user(
 
 
 @router.get("", response_model=List[UserResponse])
-async def list_users(
+def list_users(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
@@ -93,9 +93,10 @@ async def list_users(
     # Build response with plant IDs, role IDs, and permissions for each user
     response = []
     for user in users:
-        plant_ids = user_crud.get_user_plant_ids(db, user.id)
-        role_ids = user_crud.get_user_role_ids(db, user.id)
-        permissions = user_crud.get_user_permissions(db, user.id)
+        # Relationships are eager-loaded by get_all_users, so this issues no per-user queries
+        plant_ids = [pp.plant_id for pp in user.plant_permissions]
+        role_ids = [role.id for role in user.roles]
+        permissions = list({perm.code for role in user.roles for perm in role.permissions})
         response.append(UserResponse(
             id=user.id,
             username=user.username,
@@ -113,7 +114,7 @@ async def list_users(
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(
+def get_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_superadmin)
@@ -159,7 +160,7 @@ async def get_user(
 
 
 @router.put("/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: int,
     user_data: UserUpdate,
     db: Session = Depends(get_db),
@@ -243,7 +244,7 @@ async def update_user(
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(
+def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission("can_delete_users"))
@@ -296,7 +297,7 @@ async def delete_user(
 
 
 @router.get("/{user_id}/permissions", response_model=List[str])
-async def get_user_permissions(
+def get_user_permissions(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_superadmin)
@@ -32,10 +32,10 @@ def read_weight_classifications_by_plant(
     if plant is None:
         raise HTTPException(status_code=404, detail="Plant not found")
     
-    weight_classifications = crud.get_weight_classifications_by_plant(
-        db, plant_id=plant_id, skip=skip, limit=limit
-    )
-    return weight_classifications
+    return [
+        WeightClassificationResponse.from_orm_fast(wc)
+        for wc in crud.get_weight_classifications_by_plant(db, plant_id=plant_id, skip=skip, limit=limit)
+    ]
 
 
 @router.get("/weight-classifications/{wc_id}", response_model=WeightClassificationResponse)
@@ -197,7 +197,9 @@ def copy_weight_classifications_from_dressed(
                 category="Frozen",
                 default_heads=dressed_wc.default_heads
             )
-            crud.create_weight_classification(db, frozen_wc)
+            # A savepoint per row, so a failed flush only undoes that row and the batch continues
+            with db.begin_nested():
+                crud.create_weight_classification(db, frozen_wc, commit=False)
             created += 1
             existing_frozen.add(dressed_wc.classification.lower())  # Update set to prevent duplicates in same batch
         except Exception as e:
@@ -205,6 +207,10 @@ def copy_weight_classifications_from_dressed(
             skipped += 1
             continue
     
+    # Commit all copied classifications in a single transaction
+    if created:
+        db.commit()
+    
     return CopyFromDressedResponse(
         created=created,
         skipped=skipped,
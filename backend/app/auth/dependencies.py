@@ -25,7 +25,7 @@ def user_has_role(user: User, role_name: str) -> bool:
     return any(role.name == role_name for role in user.roles)
 
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -95,7 +95,7 @@ def check_plant_access(plant_id: int):
     Users with SUPERADMIN role have access to all plants.
     Other users need explicit plant permission.
     """
-    async def _check_access(
+    def _check_access(
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
     ) -> User:
@@ -120,7 +120,7 @@ def check_plant_access(plant_id: int):
     return _check_access
 
 
-async def get_user_accessible_plant_ids(
+def get_user_accessible_plant_ids(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> list[int]:
@@ -155,7 +155,7 @@ def require_permission(permission_code: str):
     Returns:
         Dependency function that checks if user has the permission
     """
-    async def _check_permission(
+    def _check_permission(
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
     ) -> User:
@@ -188,7 +188,7 @@ def require_any_permission(permission_codes: List[str]):
     Returns:
         Dependency function that checks if user has any of the permissions
     """
-    async def _check_permissions(
+    def _check_permissions(
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
     ) -> User:
@@ -224,7 +224,7 @@ def require_all_permissions(permission_codes: List[str]):
     Returns:
         Dependency function that checks if user has all of the permissions
     """
-    async def _check_permissions(
+    def _check_permissions(
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
     ) -> User:
@@ -263,7 +263,7 @@ def require_permission_and_plant_access(permission_code: str, plant_id: int):
     Returns:
         Dependency function that checks both permission and plant access
     """
-    async def _check_both(
+    def _check_both(
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
     ) -> User:
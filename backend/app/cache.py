@@ -0,0 +1,49 @@
+"""
+Small in-process TTL cache for health probes.
+
+Each worker process keeps its own copy and clear() only reaches the worker that
+calls it, so this is not used for data that endpoints write (customer, plant and
+weight classification lists would be served stale by the other workers).
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire `ttl` seconds after being stored."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        # Bumped on clear() so a load that started before an invalidation is not stored
+        self._generation = 0
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling factory() to (re)load it when missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            generation = self._generation
+
+        value = factory()
+
+        with self._lock:
+            if generation == self._generation:
+                if len(self._data) >= self.maxsize:
+                    self._data.clear()
+                self._data[key] = (now + self.ttl, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+
+
+# Only successful DB health checks are cached, to rate-limit load balancer pings
+db_health_cache = TTLCache(ttl=5, maxsize=1)
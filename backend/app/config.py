@@ -9,6 +9,13 @@ class Settings(BaseSettings):
     debug: bool = True
     cors_origins: str = "*"  # Comma-separated list of origins, or "*" for all
     
+    # Database connection budget for the whole instance, split evenly across the uvicorn
+    # worker processes (each has its own engine and pool). Keep pool + overflow within the
+    # Azure SQL tier's session/worker limit for every instance that shares the database.
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    web_concurrency: int = 1  # Number of uvicorn workers; the startup scripts export WEB_CONCURRENCY
+    
     # Authentication settings
     # IMPORTANT: SECRET_KEY should be set in .env file for production
     # If not set, a random key will be generated (NOT recommended for production)
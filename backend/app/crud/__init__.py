@@ -1,3 +1,11 @@
+"""
+CRUD helpers.
+
+Single-write helpers commit their own transaction by default. Helpers that are
+also used as building blocks of a larger write (bulk seeding, copy endpoints,
+log entry edits with audit trail) accept ``commit=False`` or only ``flush()``,
+so the caller can commit once per request instead of once per row.
+"""
 from . import customer
 from . import plant
 from . import weight_classification
@@ -1,11 +1,14 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..models.allocation_details import AllocationDetails
 from ..models.tally_log_entry import TallyLogEntry, TallyLogEntryRole
 from ..schemas.allocation_details import AllocationDetailsCreate, AllocationDetailsUpdate
 
+_CREATE_FIELDS = tuple(AllocationDetailsCreate.model_fields)
 
-def create_allocation_detail(db: Session, allocation_detail: AllocationDetailsCreate) -> AllocationDetails:
+
+def create_allocation_detail(db: Session, allocation_detail: AllocationDetailsCreate, commit: bool = True) -> AllocationDetails:
     # Check if allocation already exists for this session and weight classification
     existing = db.query(AllocationDetails).filter(
         AllocationDetails.tally_session_id == allocation_detail.tally_session_id,
@@ -15,15 +18,31 @@ def create_allocation_detail(db: Session, allocation_detail: AllocationDetailsCr
     if existing:
         raise ValueError("Allocation detail already exists for this session and weight classification")
     
-    db_allocation = AllocationDetails(**allocation_detail.model_dump())
+    db_allocation = AllocationDetails(**{field: getattr(allocation_detail, field) for field in _CREATE_FIELDS})
     db.add(db_allocation)
+    if not commit:
+        # Caller batches several writes and commits once
+        db.flush()
+        return db_allocation
     db.commit()
-    db.refresh(db_allocation)
     return db_allocation
 
 
+def create_allocation_details_bulk(db: Session, allocation_details: List[AllocationDetailsCreate]) -> int:
+    """
+    Insert many allocations with a single executemany INSERT, bypassing the unit of work.
+    Does not check for existing (session, weight classification) pairs, so callers must
+    only pass new combinations. Does not commit; returns the number of rows inserted.
+    """
+    if not allocation_details:
+        return 0
+    rows = [{field: getattr(allocation, field) for field in _CREATE_FIELDS} for allocation in allocation_details]
+    db.execute(insert(AllocationDetails), rows)
+    return len(rows)
+
+
 def get_allocation_detail(db: Session, allocation_id: int) -> Optional[AllocationDetails]:
-    return db.query(AllocationDetails).filter(AllocationDetails.id == allocation_id).first()
+    return db.get(AllocationDetails, allocation_id)
 
 
 def get_allocation_details_by_session(db: Session, session_id: int) -> List[AllocationDetails]:
@@ -74,7 +93,6 @@ def update_allocation_detail(db: Session, allocation_id: int, allocation_update:
         setattr(db_allocation, field, value)
     
     db.commit()
-    db.refresh(db_allocation)
     return db_allocation
 
 
@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..models.customer import Customer
@@ -5,16 +6,30 @@ from ..models.tally_session import TallySession
 from ..schemas.customer import CustomerCreate, CustomerUpdate
 
 
-def create_customer(db: Session, customer: CustomerCreate) -> Customer:
+def create_customer(db: Session, customer: CustomerCreate, commit: bool = True) -> Customer:
     db_customer = Customer(**customer.model_dump())
     db.add(db_customer)
+    if not commit:
+        # Caller batches several writes and commits once
+        db.flush()
+        return db_customer
     db.commit()
-    db.refresh(db_customer)
     return db_customer
 
 
+def create_customers_bulk(db: Session, customers: List[CustomerCreate]) -> List[Customer]:
+    """
+    Insert many customers with one batched INSERT ... RETURNING, bypassing the unit of work.
+    Does not commit; returns the new rows in the same order as the input.
+    """
+    if not customers:
+        return []
+    rows = [customer.model_dump() for customer in customers]
+    return list(db.scalars(insert(Customer).returning(Customer, sort_by_parameter_order=True), rows))
+
+
 def get_customer(db: Session, customer_id: int) -> Optional[Customer]:
-    return db.query(Customer).filter(Customer.id == customer_id).first()
+    return db.get(Customer, customer_id)
 
 
 def get_customers(db: Session, skip: int = 0, limit: int = 100) -> List[Customer]:
@@ -32,7 +47,6 @@ def update_customer(db: Session, customer_id: int, customer_update: CustomerUpda
         setattr(db_customer, field, value)
     
     db.commit()
-    db.refresh(db_customer)
     return db_customer
 
 
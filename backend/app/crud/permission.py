@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 from ..models.permission import Permission
 from ..models.role import Role
 
@@ -16,7 +16,16 @@ def get_permission_by_code(db: Session, code: str) -> Optional[Permission]:
 
 def get_permission_by_id(db: Session, permission_id: int) -> Optional[Permission]:
     """Get a permission by its ID."""
-    return db.query(Permission).filter(Permission.id == permission_id).first()
+    return db.get(Permission, permission_id)
+
+
+def get_existing_permission_ids(db: Session, permission_ids: Iterable[int]) -> Set[int]:
+    """Return the subset of permission_ids that exist, resolved with a single IN query."""
+    ids = set(permission_ids)
+    if not ids:
+        return set()
+    rows = db.query(Permission.id).filter(Permission.id.in_(ids)).all()
+    return {row.id for row in rows}
 
 
 def get_permissions_by_role(db: Session, role_id: int) -> List[Permission]:
@@ -10,12 +10,15 @@ def create_plant(db: Session, plant: PlantCreate) -> Plant:
     db_plant = Plant(**plant.model_dump())
     db.add(db_plant)
     db.commit()
-    db.refresh(db_plant)
     return db_plant
 
 
 def get_plant(db: Session, plant_id: int) -> Optional[Plant]:
-    return db.query(Plant).filter(Plant.id == plant_id).first()
+    return db.get(Plant, plant_id)
+
+
+def get_plant_by_name(db: Session, name: str) -> Optional[Plant]:
+    return db.query(Plant).filter(Plant.name == name).first()
 
 
 def get_plants(db: Session, skip: int = 0, limit: int = 100) -> List[Plant]:
@@ -33,7 +36,6 @@ def update_plant(db: Session, plant_id: int, plant_update: PlantUpdate) -> Optio
         setattr(db_plant, field, value)
     
     db.commit()
-    db.refresh(db_plant)
     return db_plant
 
 
@@ -1,10 +1,11 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..models.role import Role
-from ..models.permission import Permission
 from ..models.role_permission import RolePermission
 from ..models.user_role import UserRole as UserRoleModel
 from ..schemas.role import RoleCreate, RoleUpdate
+from .permission import get_existing_permission_ids
+from .user import clear_permissions_cache
 
 
 def get_all_roles(db: Session, skip: int = 0, limit: int = 100) -> List[Role]:
@@ -14,7 +15,7 @@ def get_all_roles(db: Session, skip: int = 0, limit: int = 100) -> List[Role]:
 
 def get_role_by_id(db: Session, role_id: int) -> Optional[Role]:
     """Get a role by its ID."""
-    return db.query(Role).filter(Role.id == role_id).first()
+    return db.get(Role, role_id)
 
 
 def get_role_by_name(db: Session, name: str) -> Optional[Role]:
@@ -68,6 +69,7 @@ def update_role(db: Session, role_id: int, role_data: RoleUpdate) -> Optional[Ro
     if role_data.permission_ids is not None:
         # Remove existing permissions
         db.query(RolePermission).filter(RolePermission.role_id == role_id).delete()
+        clear_permissions_cache(db)
         
         # Add new permissions
         for permission_id in role_data.permission_ids:
@@ -113,12 +115,12 @@ def assign_permissions_to_role(db: Session, role_id: int, permission_ids: List[i
     
     # Remove existing permissions
     db.query(RolePermission).filter(RolePermission.role_id == role_id).delete()
+    clear_permissions_cache(db)
     
-    # Add new permissions
+    # Add new permissions, skipping IDs that do not exist
+    existing_ids = get_existing_permission_ids(db, permission_ids)
     for permission_id in permission_ids:
-        # Verify permission exists
-        permission = db.query(Permission).filter(Permission.id == permission_id).first()
-        if permission:
+        if permission_id in existing_ids:
             role_permission = RolePermission(
                 role_id=role_id,
                 permission_id=permission_id
@@ -140,6 +142,7 @@ def remove_permission_from_role(db: Session, role_id: int, permission_id: int) -
         RolePermission.role_id == role_id,
         RolePermission.permission_id == permission_id
     ).delete()
+    clear_permissions_cache(db)
     
     db.commit()
     return result > 0
@@ -1,3 +1,4 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from collections import defaultdict
@@ -8,7 +9,6 @@ from ..schemas.tally_log_entry import TallyLogEntryCreate, TallyLogEntryUpdate
 from ..crud import tally_session as session_crud
 from ..crud import weight_classification as wc_crud
 from ..crud import tally_log_entry_audit as audit_crud
-from ..models.utils import utcnow
 
 
 def create_tally_log_entry(db: Session, log_entry: TallyLogEntryCreate) -> TallyLogEntry:
@@ -40,16 +40,15 @@ def create_tally_log_entry(db: Session, log_entry: TallyLogEntryCreate) -> Tally
     
     if not allocation:
         # Create new allocation detail if it doesn't exist
-        from ..schemas.allocation_details import AllocationDetailsCreate
-        allocation_create = AllocationDetailsCreate(
+        # Built directly on the model to skip the uniqueness check in crud and schema validation
+        allocation = AllocationDetails(
             tally_session_id=log_entry.tally_session_id,
             weight_classification_id=log_entry.weight_classification_id,
             required_bags=0.0,
             allocated_bags_tally=0.0,
-            allocated_bags_dispatcher=0.0
+            allocated_bags_dispatcher=0.0,
+            heads=0.0
         )
-        # Create directly in the database to avoid the uniqueness check in crud
-        allocation = AllocationDetails(**allocation_create.model_dump())
         db.add(allocation)
         db.flush()  # Flush to get the ID without committing
     
@@ -79,15 +78,13 @@ def create_tally_log_entry(db: Session, log_entry: TallyLogEntryCreate) -> Tally
     
     # Commit both changes atomically
     db.commit()
-    db.refresh(db_log_entry)
-    db.refresh(allocation)
     
     return db_log_entry
 
 
 def get_tally_log_entry(db: Session, entry_id: int) -> Optional[TallyLogEntry]:
     """Get a single tally log entry by ID."""
-    return db.query(TallyLogEntry).filter(TallyLogEntry.id == entry_id).first()
+    return db.get(TallyLogEntry, entry_id)
 
 
 def get_tally_log_entries_by_session(
@@ -113,7 +110,8 @@ def get_tally_log_entries_by_session(
     total_count = query.count()
     
     # Apply ordering
-    query = query.order_by(TallyLogEntry.created_at.desc())
+    # id breaks ties between entries created within the same timestamp tick
+    query = query.order_by(TallyLogEntry.created_at.desc(), TallyLogEntry.id.desc())
     
     # Apply pagination if provided
     if limit is not None:
@@ -311,15 +309,14 @@ def update_tally_log_entry(db: Session, entry_id: int, entry_update: TallyLogEnt
 
     if not new_allocation:
         # Create new allocation detail if it doesn't exist
-        from ..schemas.allocation_details import AllocationDetailsCreate
-        allocation_create = AllocationDetailsCreate(
+        new_allocation = AllocationDetails(
             tally_session_id=new_session_id,
             weight_classification_id=new_wc_id,
             required_bags=0.0,
             allocated_bags_tally=0.0,
-            allocated_bags_dispatcher=0.0
+            allocated_bags_dispatcher=0.0,
+            heads=0.0
         )
-        new_allocation = AllocationDetails(**allocation_create.model_dump())
         db.add(new_allocation)
         db.flush()  # Flush to get the ID without committing
 
@@ -333,14 +330,12 @@ def update_tally_log_entry(db: Session, entry_id: int, entry_update: TallyLogEnt
         new_allocation.heads = 0.0
     new_allocation.heads += new_heads_value
 
-    # Commit all changes atomically
-    db.commit()
-    db.refresh(log_entry)
-    
     # Create audit entry if any changes were made
     if changes:
         audit_crud.create_audit_entry(db, entry_id, user_id, changes)
-        db.commit()  # Commit audit entry
+
+    # Commit the edit, allocation adjustments and audit entry atomically
+    db.commit()
     
     return log_entry
 
@@ -441,8 +436,8 @@ def transfer_tally_log_entries(db: Session, entry_ids: List[int], target_session
         if entry.original_session_id is None:
             entry.original_session_id = entry.tally_session_id
         
-        # Set transferred_at timestamp
-        entry.transferred_at = utcnow()
+        # Set transferred_at timestamp from the database clock, like the other timestamp columns
+        entry.transferred_at = func.now()
         
         # Update entry's tally_session_id
         entry.tally_session_id = target_session_id
@@ -455,15 +450,14 @@ def transfer_tally_log_entries(db: Session, entry_ids: List[int], target_session
         
         if not target_allocation:
             # Create new allocation detail if it doesn't exist
-            from ..schemas.allocation_details import AllocationDetailsCreate
-            allocation_create = AllocationDetailsCreate(
+            target_allocation = AllocationDetails(
                 tally_session_id=target_session_id,
                 weight_classification_id=entry.weight_classification_id,
                 required_bags=0.0,
                 allocated_bags_tally=0.0,
-                allocated_bags_dispatcher=0.0
+                allocated_bags_dispatcher=0.0,
+                heads=0.0
             )
-            target_allocation = AllocationDetails(**allocation_create.model_dump())
             db.add(target_allocation)
             db.flush()  # Flush to get the ID without committing
         
@@ -504,15 +498,14 @@ def transfer_tally_log_entries(db: Session, entry_ids: List[int], target_session
             
             if not target_allocation:
                 # This shouldn't happen as we already created it above, but handle it just in case
-                from ..schemas.allocation_details import AllocationDetailsCreate
-                allocation_create = AllocationDetailsCreate(
+                target_allocation = AllocationDetails(
                     tally_session_id=target_session_id,
                     weight_classification_id=wc_id,
                     required_bags=0.0,
                     allocated_bags_tally=0.0,
-                    allocated_bags_dispatcher=0.0
+                    allocated_bags_dispatcher=0.0,
+                    heads=0.0
                 )
-                target_allocation = AllocationDetails(**allocation_create.model_dump())
                 db.add(target_allocation)
                 db.flush()
             
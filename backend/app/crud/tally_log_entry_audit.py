@@ -17,6 +17,7 @@ def create_audit_entry(
 ) -> TallyLogEntryAudit:
     """
     Create an audit entry for a tally log entry edit.
+    Only flushes; the caller commits it together with the edit it describes.
     
     Args:
         db: Database session
@@ -33,8 +34,7 @@ def create_audit_entry(
         changes=changes
     )
     db.add(audit_entry)
-    db.commit()
-    db.refresh(audit_entry)
+    db.flush()
     return audit_entry
 
 
@@ -55,7 +55,7 @@ def get_audit_entries_by_entry_id(
     """
     return db.query(TallyLogEntryAudit).filter(
         TallyLogEntryAudit.tally_log_entry_id == entry_id
-    ).order_by(TallyLogEntryAudit.edited_at.desc()).all()
+    ).order_by(TallyLogEntryAudit.edited_at.desc(), TallyLogEntryAudit.id.desc()).all()
 
 
 def get_all_audit_entries(
@@ -86,6 +86,6 @@ def get_all_audit_entries(
             .joinedload(TallyLogEntry.weight_classification),
             joinedload(TallyLogEntryAudit.user)
         )\
-        .order_by(TallyLogEntryAudit.edited_at.desc())\
+        .order_by(TallyLogEntryAudit.edited_at.desc(), TallyLogEntryAudit.id.desc())\
         .limit(limit)\
         .all()
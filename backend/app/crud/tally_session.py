@@ -1,12 +1,18 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert, select
 from typing import List, Optional
 from datetime import date
 from ..models.tally_session import TallySession
+from ..models.allocation_details import AllocationDetails
+from ..models.tally_log_entry import TallyLogEntry
+from ..models.tally_log_entry_audit import TallyLogEntryAudit
 from ..schemas.tally_session import TallySessionCreate, TallySessionUpdate
 
+# Create-schema fields map 1:1 onto model columns; reading them directly avoids a model_dump() copy
+_CREATE_FIELDS = tuple(TallySessionCreate.model_fields)
 
-def create_tally_session(db: Session, tally_session: TallySessionCreate) -> TallySession:
+
+def create_tally_session(db: Session, tally_session: TallySessionCreate, commit: bool = True) -> TallySession:
     # Generate the next session number for this customer
     # Use a subquery to get the max session_number for this customer, or 0 if none exists
     max_session_number = db.query(func.coalesce(func.max(TallySession.session_number), 0)).filter(
@@ -16,18 +22,49 @@ def create_tally_session(db: Session, tally_session: TallySessionCreate) -> Tall
     next_session_number = max_session_number + 1
     
     # Create the session with the generated session_number
-    session_data = tally_session.model_dump()
+    session_data = {field: getattr(tally_session, field) for field in _CREATE_FIELDS}
     session_data['session_number'] = next_session_number
     
     db_session = TallySession(**session_data)
     db.add(db_session)
+    if not commit:
+        # Caller batches several writes and commits once
+        db.flush()
+        return db_session
     db.commit()
-    db.refresh(db_session)
     return db_session
 
 
+def create_tally_sessions_bulk(db: Session, tally_sessions: List[TallySessionCreate]) -> List[TallySession]:
+    """
+    Insert many sessions with one batched INSERT ... RETURNING, bypassing the unit of work.
+    Session numbers continue from each customer's current max, read with a single grouped query.
+    Does not commit; returns the new rows in the same order as the input.
+    """
+    if not tally_sessions:
+        return []
+    
+    customer_ids = {tally_session.customer_id for tally_session in tally_sessions}
+    next_numbers = dict(
+        db.query(TallySession.customer_id, func.max(TallySession.session_number)).filter(
+            TallySession.customer_id.in_(customer_ids)
+        ).group_by(TallySession.customer_id).all()
+    )
+    
+    rows = []
+    for tally_session in tally_sessions:
+        session_number = next_numbers.get(tally_session.customer_id, 0) + 1
+        next_numbers[tally_session.customer_id] = session_number
+        session_data = {field: getattr(tally_session, field) for field in _CREATE_FIELDS}
+        session_data['session_number'] = session_number
+        rows.append(session_data)
+    
+    return list(db.scalars(insert(TallySession).returning(TallySession, sort_by_parameter_order=True), rows))
+
+
 def get_tally_session(db: Session, session_id: int) -> Optional[TallySession]:
-    return db.query(TallySession).filter(TallySession.id == session_id).first()
+    # Primary-key lookup; served from the identity map when already loaded (hot path)
+    return db.get(TallySession, session_id)
 
 
 def get_tally_sessions(
@@ -63,7 +100,6 @@ def update_tally_session(db: Session, session_id: int, session_update: TallySess
         setattr(db_session, field, value)
     
     db.commit()
-    db.refresh(db_session)
     return db_session
 
 
@@ -72,7 +108,27 @@ def delete_tally_session(db: Session, session_id: int) -> bool:
     if not db_session:
         return False
     
-    db.delete(db_session)
+    # Delete children with one statement per table instead of letting the relationship
+    # cascade load every allocation and log entry and delete them row by row.
+    # Audit rows are deleted explicitly: SQLite doesn't enforce the FK's ON DELETE CASCADE.
+    db.query(TallyLogEntryAudit).filter(
+        TallyLogEntryAudit.tally_log_entry_id.in_(
+            select(TallyLogEntry.id).where(TallyLogEntry.tally_session_id == session_id)
+        )
+    ).delete(synchronize_session=False)
+    db.query(TallyLogEntry).filter(
+        TallyLogEntry.tally_session_id == session_id
+    ).delete(synchronize_session=False)
+    db.query(AllocationDetails).filter(
+        AllocationDetails.tally_session_id == session_id
+    ).delete(synchronize_session=False)
+    
+    # Bulk delete the session too; db.delete() would run the relationship cascade over
+    # children that are already gone (stale-row warnings if they had been loaded)
+    db.query(TallySession).filter(
+        TallySession.id == session_id
+    ).delete(synchronize_session=False)
+    db.expunge(db_session)
     db.commit()
     return True
 
@@ -82,10 +138,13 @@ def get_tally_session_dates(
     customer_id: Optional[int] = None,
     plant_id: Optional[int] = None,
     status: Optional[str] = None,
-    accessible_plant_ids: Optional[List[int]] = None
+    accessible_plant_ids: Optional[List[int]] = None,
+    since: Optional[date] = None,
+    limit: Optional[int] = None
 ) -> List[date]:
     """Get distinct dates that have tally sessions, optionally filtered by customer, plant, or status.
-    If accessible_plant_ids is provided, only returns dates for sessions in those plants."""
+    If accessible_plant_ids is provided, only returns dates for sessions in those plants.
+    since/limit bound the result to dates on or after `since` and the `limit` most recent dates."""
     query = db.query(TallySession.date).distinct()
     
     if customer_id:
@@ -96,9 +155,14 @@ def get_tally_session_dates(
         query = query.filter(TallySession.status == status)
     if accessible_plant_ids is not None:
         query = query.filter(TallySession.plant_id.in_(accessible_plant_ids))
+    if since:
+        query = query.filter(TallySession.date >= since)
     
     # Order by date descending (most recent first)
-    results = query.order_by(TallySession.date.desc()).all()
+    query = query.order_by(TallySession.date.desc())
+    if limit:
+        query = query.limit(limit)
+    results = query.all()
     # Extract date values from the result tuples
     return [result[0] for result in results]
 
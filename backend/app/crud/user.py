@@ -1,15 +1,26 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional, List
 from ..models import User, UserRole, PlantPermission
 from ..models.user_role import UserRole as UserRoleModel
 from ..models.role import Role
+from ..models.permission import Permission
+from ..models.role_permission import RolePermission
 from ..schemas.user import UserCreate, UserUpdate
 from ..auth.password import hash_password, verify_password
 
+# Key in Session.info holding {user_id: [permission codes]} for the session's lifetime.
+# The session is request-scoped (see get_db), so this memoizes permission checks per request.
+_PERMISSIONS_CACHE_KEY = "user_permissions"
+
+
+def clear_permissions_cache(db: Session) -> None:
+    """Drop memoized permission sets; call after changing role or permission assignments."""
+    db.info.pop(_PERMISSIONS_CACHE_KEY, None)
+
 
 def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
     """Get a user by their ID."""
-    return db.query(User).filter(User.id == user_id).first()
+    return db.get(User, user_id)
 
 
 def get_user_by_username(db: Session, username: str) -> Optional[User]:
@@ -24,7 +35,12 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
 
 def get_all_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
     """Get all users (for superadmin)."""
-    return db.query(User).order_by(User.id).offset(skip).limit(limit).all()
+    # Eager-load what the user list response needs (plants, roles and their permissions)
+    # with one IN query per relationship instead of three queries per user
+    return db.query(User).options(
+        selectinload(User.plant_permissions),
+        selectinload(User.roles).selectinload(Role.permissions)
+    ).order_by(User.id).offset(skip).limit(limit).all()
 
 
 def create_user(db: Session, user_data: UserCreate) -> User:
@@ -120,6 +136,7 @@ def update_user(db: Session, user_id: int, user_data: UserUpdate) -> Optional[Us
     if user_data.role_ids is not None:
         # Remove existing role assignments
         db.query(UserRoleModel).filter(UserRoleModel.user_id == user_id).delete()
+        clear_permissions_cache(db)
         
         # Add new role assignments
         for role_id in user_data.role_ids:
@@ -243,21 +260,20 @@ def get_user_permissions(db: Session, user_id: int) -> List[str]:
     Returns:
         List of unique permission codes
     """
-    # Get all roles assigned to the user
-    user_roles = db.query(UserRoleModel).filter(UserRoleModel.user_id == user_id).all()
-    role_ids = [ur.role_id for ur in user_roles]
-    
-    if not role_ids:
-        return []
-    
-    # Get all permissions from these roles
-    roles = db.query(Role).filter(Role.id.in_(role_ids)).all()
-    
-    # Aggregate unique permission codes
-    permission_codes = set()
-    for role in roles:
-        for permission in role.permissions:
-            permission_codes.add(permission.code)
-    
+    cache = db.info.setdefault(_PERMISSIONS_CACHE_KEY, {})
+    if user_id in cache:
+        return list(cache[user_id])
+    
+    # Resolve user -> roles -> permissions in a single statement; the DB does the DISTINCT
+    rows = db.query(Permission.code).join(
+        RolePermission, RolePermission.permission_id == Permission.id
+    ).join(
+        UserRoleModel, UserRoleModel.role_id == RolePermission.role_id
+    ).filter(
+        UserRoleModel.user_id == user_id
+    ).distinct().all()
+    permission_codes = [code for (code,) in rows]
+    
+    cache[user_id] = permission_codes
     return list(permission_codes)
 
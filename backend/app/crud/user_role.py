@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from typing import List
 from ..models.role import Role
 from ..models.user_role import UserRole
+from .user import clear_permissions_cache
 
 
 def assign_roles_to_user(db: Session, user_id: int, role_ids: List[int]) -> bool:
@@ -9,6 +10,7 @@ def assign_roles_to_user(db: Session, user_id: int, role_ids: List[int]) -> bool
     # Remove existing non-system role assignments
     # Keep system roles (SUPERADMIN, ADMIN) assigned via the old user.role column
     db.query(UserRole).filter(UserRole.user_id == user_id).delete()
+    clear_permissions_cache(db)
     
     # Add new role assignments
     for role_id in role_ids:
@@ -31,6 +33,7 @@ def remove_role_from_user(db: Session, user_id: int, role_id: int) -> bool:
         UserRole.user_id == user_id,
         UserRole.role_id == role_id
     ).delete()
+    clear_permissions_cache(db)
     
     db.commit()
     return result > 0
@@ -1,8 +1,11 @@
+import math
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..models.weight_classification import WeightClassification
 from ..schemas.weight_classification import WeightClassificationCreate, WeightClassificationUpdate
 
+_CREATE_FIELDS = tuple(WeightClassificationCreate.model_fields)
+
 
 def _ranges_overlap(
     min1: Optional[float], max1: Optional[float],
@@ -22,10 +25,10 @@ def _ranges_overlap(
         return False
     
     # Convert None to appropriate infinity/negative infinity for comparison
-    min1_val = float('-inf') if min1 is None else min1
-    max1_val = float('inf') if max1 is None else max1
-    min2_val = float('-inf') if min2 is None else min2
-    max2_val = float('inf') if max2 is None else max2
+    min1_val = -math.inf if min1 is None else min1
+    max1_val = math.inf if max1 is None else max1
+    min2_val = -math.inf if min2 is None else min2
+    max2_val = math.inf if max2 is None else max2
     
     # Ranges overlap if: min1 <= max2 AND min2 <= max1
     return min1_val <= max2_val and min2_val <= max1_val
@@ -122,7 +125,7 @@ def _check_overlaps(
             )
 
 
-def create_weight_classification(db: Session, weight_classification: WeightClassificationCreate) -> WeightClassification:
+def create_weight_classification(db: Session, weight_classification: WeightClassificationCreate, commit: bool = True) -> WeightClassification:
     # For byproducts, check for duplicate classification names or descriptions
     if weight_classification.category == 'Byproduct':
         _check_byproduct_duplicates(
@@ -141,15 +144,18 @@ def create_weight_classification(db: Session, weight_classification: WeightClass
             weight_classification.max_weight
         )
     
-    db_wc = WeightClassification(**weight_classification.model_dump())
+    db_wc = WeightClassification(**{field: getattr(weight_classification, field) for field in _CREATE_FIELDS})
     db.add(db_wc)
+    if not commit:
+        # Caller batches several writes and commits once
+        db.flush()
+        return db_wc
     db.commit()
-    db.refresh(db_wc)
     return db_wc
 
 
 def get_weight_classification(db: Session, wc_id: int) -> Optional[WeightClassification]:
-    return db.query(WeightClassification).filter(WeightClassification.id == wc_id).first()
+    return db.get(WeightClassification, wc_id)
 
 
 def get_weight_classifications_by_plant(db: Session, plant_id: int, skip: int = 0, limit: int = 100) -> List[WeightClassification]:
@@ -200,7 +206,6 @@ def update_weight_classification(db: Session, wc_id: int, wc_update: WeightClass
         setattr(db_wc, field, value)
     
     db.commit()
-    db.refresh(db_wc)
     return db_wc
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
@@ -11,26 +11,56 @@ if "sqlite" in settings.database_url:
 else:
     # For Azure SQL Database, use connection pooling and timeout settings
     connect_args = {}
+    # Every worker process builds its own pool, so each gets its share of the instance budget
+    workers = max(1, settings.web_concurrency)
     # Add connection pool settings for Azure SQL
     engine_kwargs = {
         "pool_pre_ping": True,  # Verify connections before using
-        "pool_recycle": 3600,   # Recycle connections after 1 hour
+        "pool_recycle": 1800,   # Recycle connections after 30 minutes (Azure SQL drops idle connections ~30 min)
+        "insertmanyvalues_page_size": 1000,  # Rows per batched multi-row INSERT
+        "pool_size": max(1, settings.db_pool_size // workers),  # Connections kept open per worker
+        "max_overflow": max(0, settings.db_max_overflow // workers),  # Extra connections allowed during bursts
+        "pool_timeout": 10,     # Fail fast instead of queueing on an exhausted pool
+        "pool_use_lifo": True,  # Reuse the most recently returned (warm) connection
     }
+    # pyodbc: send executemany() parameter sets in one round trip (bulk inserts)
+    if "pyodbc" in settings.database_url:
+        engine_kwargs["fast_executemany"] = True
+        connect_args["timeout"] = 30  # Connection/login timeout in seconds
 
 engine = create_engine(
     settings.database_url,
     connect_args=connect_args,
+    query_cache_size=1200,  # Compiled-statement cache; the default 500 is too small for all our query shapes
     **engine_kwargs
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Autoflush stays off: CRUD helpers flush/commit explicitly, so read paths don't
+# trigger implicit flushes
+# expire_on_commit=False keeps committed objects loaded, so returning them from a
+# write endpoint doesn't re-SELECT the row (server-side timestamps come back via RETURNING).
+# Helpers that rewrite relationships through bulk deletes still call db.refresh().
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
 
 
+def create_missing_tables() -> None:
+    """
+    Create any model tables that don't exist yet (used by the standalone seed scripts).
+    Lists existing tables with one query instead of create_all's per-table existence check.
+    """
+    existing_tables = set(inspect(engine).get_table_names())
+    missing_tables = [table for table in Base.metadata.sorted_tables if table.name not in existing_tables]
+    if missing_tables:
+        Base.metadata.create_all(bind=engine, tables=missing_tables, checkfirst=False)
+
+
 # Dependency to get database session
+# The session is synchronous: endpoints and dependencies that use it must be plain `def`
+# (not `async def`) so FastAPI runs them in its threadpool instead of blocking the event loop
 def get_db():
     db = SessionLocal()
     try:
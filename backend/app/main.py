@@ -1,11 +1,17 @@
 import logging
 import traceback
-from fastapi import FastAPI, Request, status
+from fastapi import APIRouter, Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import configure_mappers
 from .config import settings
+from .cache import db_health_cache
+from .database import engine
+from .auth.dependencies import require_superadmin
 from .api.routes import customers, plants, weight_classifications, tally_sessions, allocation_details, tally_log_entries, export, auth, users, roles, permissions, console
 
 # Configure logging
@@ -15,13 +21,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Resolve all relationship() string references now (the routers above imported every model),
+# so mapper configuration happens at startup instead of on the first request and
+# misconfigured back_populates fail at import time
+configure_mappers()
+
 app = FastAPI(
     title="Tally System API",
     description="Backend API for Tally System - Chicken Parts Inventory Management",
     version="2.0.0",
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse  # orjson encodes responses several times faster than stdlib json
 )
 
+# Compress larger JSON payloads (session lists, exports, log entries).
+# Added before CORS so CORS stays the outermost middleware.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware
 # Get allowed origins from settings (can be configured via CORS_ORIGINS env var)
 # Defaults to "*" (allow all) if not set
@@ -32,24 +48,93 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+# Development diagnostics: surface slow queries and endpoints whose query count suggests N+1 lazy loads
+if settings.debug:
+    import time
+    from contextvars import ContextVar
+    from typing import List, Optional
+    from sqlalchemy import event
+
+    SLOW_QUERY_THRESHOLD_SECONDS = 0.05
+    QUERY_COUNT_WARNING_THRESHOLD = 20  # Queries per request before an endpoint is flagged
+    slow_query_logger = logging.getLogger("sqlalchemy.slow_query")
+    # Per-request query counter; a mutable list so threadpool endpoints update the same object
+    _request_query_count: ContextVar[Optional[List[int]]] = ContextVar("request_query_count", default=None)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+        counter = _request_query_count.get()
+        if counter is not None:
+            counter[0] += 1
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        if elapsed > SLOW_QUERY_THRESHOLD_SECONDS:
+            slow_query_logger.warning(f"Slow query ({elapsed * 1000:.1f} ms): {statement}")
+
+    @app.middleware("http")
+    async def count_queries(request: Request, call_next):
+        counter = [0]
+        token = _request_query_count.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            _request_query_count.reset(token)
+        if counter[0] > QUERY_COUNT_WARNING_THRESHOLD:
+            slow_query_logger.warning(
+                f"{request.method} {request.url.path} issued {counter[0]} queries "
+                f"(threshold {QUERY_COUNT_WARNING_THRESHOLD}); check for N+1 lazy loads"
+            )
+        return response
+
 # Include routers
+# All API routes are grouped under a single versioned parent router
+api_router = APIRouter(prefix=settings.api_v1_prefix)
+
 # Authentication routes (no auth required for login)
-app.include_router(auth.router, prefix=f"{settings.api_v1_prefix}/auth", tags=["auth"])
-app.include_router(users.router, prefix=f"{settings.api_v1_prefix}/users", tags=["users"])
-app.include_router(roles.router, prefix=f"{settings.api_v1_prefix}/roles", tags=["roles"])
-app.include_router(permissions.router, prefix=f"{settings.api_v1_prefix}/permissions", tags=["permissions"])
+api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
+api_router.include_router(users.router, prefix="/users", tags=["users"])
+api_router.include_router(roles.router, prefix="/roles", tags=["roles"])
+api_router.include_router(permissions.router, prefix="/permissions", tags=["permissions"])
 
 # Other routes
-app.include_router(customers.router, prefix=settings.api_v1_prefix, tags=["customers"])
-app.include_router(plants.router, prefix=settings.api_v1_prefix, tags=["plants"])
-app.include_router(weight_classifications.router, prefix=settings.api_v1_prefix, tags=["weight-classifications"])
-app.include_router(tally_sessions.router, prefix=settings.api_v1_prefix, tags=["tally-sessions"])
-app.include_router(allocation_details.router, prefix=settings.api_v1_prefix, tags=["allocation-details"])
-app.include_router(tally_log_entries.router, prefix=settings.api_v1_prefix, tags=["tally-log-entries"])
-app.include_router(export.router, prefix=f"{settings.api_v1_prefix}/export", tags=["export"])
-app.include_router(console.router, prefix=f"{settings.api_v1_prefix}", tags=["console"])
+api_router.include_router(customers.router, tags=["customers"])
+api_router.include_router(plants.router, tags=["plants"])
+api_router.include_router(weight_classifications.router, tags=["weight-classifications"])
+api_router.include_router(tally_sessions.router, tags=["tally-sessions"])
+api_router.include_router(allocation_details.router, tags=["allocation-details"])
+api_router.include_router(tally_log_entries.router, tags=["tally-log-entries"])
+api_router.include_router(export.router, prefix="/export", tags=["export"])
+api_router.include_router(console.router, tags=["console"])
+
+app.include_router(api_router)
+
+# Connections opened at startup so the first requests don't pay the Azure SQL login/TLS handshake
+POOL_WARMUP_CONNECTIONS = 5
+
+
+@app.on_event("startup")
+def warm_connection_pool():
+    """Pre-open a few pooled database connections. Failures are logged, not fatal."""
+    if "sqlite" in settings.database_url:
+        return
+    connections = []
+    try:
+        for _ in range(min(POOL_WARMUP_CONNECTIONS, engine.pool.size())):
+            conn = engine.connect()
+            connections.append(conn)
+            conn.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.warning(f"Connection pool warm-up failed: {str(e)}")
+    finally:
+        # Return the connections to the pool, where they stay open
+        for conn in connections:
+            conn.close()
 
 
 @app.get("/")
@@ -63,25 +148,32 @@ async def health_check():
     return {"status": "healthy"}
 
 
+# Host/port part of the database URL (credentials stripped), computed once for health responses
+DB_HOST_DISPLAY = settings.database_url.split("@")[-1].split("/")[0] if "@" in settings.database_url else "local"
+
+
 @app.get("/health/db")
-async def database_health_check():
-    """Database health check endpoint."""
-    from .database import engine
-    from sqlalchemy import text
-    try:
+def database_health_check():
+    """Database health check endpoint. Successful checks are cached for a few seconds."""
+    def ping():
         # Try to connect to the database
         with engine.connect() as conn:
             # Try a simple query
             result = conn.execute(text("SELECT 1"))
             result.fetchone()
+        return True
+
+    try:
+        # Failures raise and are therefore never cached
+        db_health_cache.get_or_set("ping", ping)
         return {
             "status": "healthy",
             "database": "connected",
-            "database_url": settings.database_url.split("@")[-1].split("/")[0] if "@" in settings.database_url else "local"
+            "database_url": DB_HOST_DISPLAY
         }
     except Exception as e:
         logger.error(f"Database health check failed: {str(e)}", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={
                 "status": "unhealthy",
@@ -92,22 +184,33 @@ async def database_health_check():
         )
 
 
+# Pool internals are operational detail, so unlike the other health checks this one needs a superadmin
+@app.get("/health/db/pool", dependencies=[Depends(require_superadmin)])
+def database_pool_status():
+    """Connection pool statistics endpoint (superadmin only)."""
+    return {
+        "pool_class": type(engine.pool).__name__,
+        "status": engine.pool.status()
+    }
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler to catch all unhandled exceptions."""
+    # exc_info already renders the traceback into the log record; only format it
+    # a second time when it is also returned to the client (debug mode)
     logger.error(
         f"Unhandled exception: {type(exc).__name__}: {str(exc)}",
         exc_info=True,
         extra={
             "path": request.url.path,
-            "method": request.method,
-            "traceback": traceback.format_exc()
+            "method": request.method
         }
     )
     
     # In production, don't expose full traceback
     if settings.debug:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "detail": str(exc),
@@ -116,7 +219,7 @@ async def global_exception_handler(request: Request, exc: Exception):
             }
         )
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "detail": "Internal server error. Please check logs for details.",
@@ -137,7 +240,7 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Database error occurred. Please check database connection and configuration.",
@@ -150,18 +253,20 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors."""
+    errors = exc.errors()
     logger.warning(
-        f"Validation error: {exc.errors()}",
+        "Validation error: %s",
+        errors,
         extra={
             "path": request.url.path,
             "method": request.method
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
-            "detail": exc.errors(),
+            "detail": errors,
             "body": exc.body
         }
     )
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, Index
+from sqlalchemy import Column, Integer, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from ..database import Base
-from .utils import utcnow
+from .utils import UTCDateTime
 
 
 class AllocationDetails(Base):
@@ -14,15 +15,20 @@ class AllocationDetails(Base):
     allocated_bags_tally = Column(Float, nullable=False, default=0.0)
     allocated_bags_dispatcher = Column(Float, nullable=False, default=0.0)
     heads = Column(Float, nullable=True, default=0.0)
-    created_at = Column(DateTime(timezone=True), default=utcnow)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    created_at = Column(UTCDateTime, server_default=func.now())
+    updated_at = Column(UTCDateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     tally_session = relationship("TallySession", back_populates="allocation_details")
     weight_classification = relationship("WeightClassification", back_populates="allocation_details")
 
     # Index for common queries
+    # On SQL Server/PostgreSQL the bag/head measures are INCLUDEd so per-session reads are index-only
     __table_args__ = (
-        Index('idx_session_classification', 'tally_session_id', 'weight_classification_id', unique=True),
+        Index(
+            'idx_session_classification', 'tally_session_id', 'weight_classification_id', unique=True,
+            mssql_include=['required_bags', 'allocated_bags_tally', 'allocated_bags_dispatcher', 'heads'],
+            postgresql_include=['required_bags', 'allocated_bags_tally', 'allocated_bags_dispatcher', 'heads'],
+        ),
     )
 
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from ..database import Base
-from .utils import utcnow
+from .utils import UTCDateTime
 
 
 class Permission(Base):
@@ -12,7 +13,7 @@ class Permission(Base):
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     category = Column(String(50), nullable=False)
-    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    created_at = Column(UTCDateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     roles = relationship("Role", secondary="role_permissions", back_populates="permissions")
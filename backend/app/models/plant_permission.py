@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from ..database import Base
-from .utils import utcnow
+from .utils import UTCDateTime
 
 
 class PlantPermission(Base):
@@ -10,7 +11,7 @@ class PlantPermission(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     plant_id = Column(Integer, ForeignKey("plants.id", ondelete="CASCADE"), nullable=False, index=True)
-    created_at = Column(DateTime(timezone=True), default=utcnow)
+    created_at = Column(UTCDateTime, server_default=func.now())
 
     # Relationships
     user = relationship("User", back_populates="plant_permissions")
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from ..database import Base
-from .utils import utcnow
+from .utils import UTCDateTime
 
 
 class Role(Base):
@@ -11,8 +12,8 @@ class Role(Base):
     name = Column(String(100), unique=True, nullable=False, index=True)
     description = Column(Text, nullable=True)
     is_system = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False)
+    created_at = Column(UTCDateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(UTCDateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     permissions = relationship("Permission", secondary="role_permissions", back_populates="roles")
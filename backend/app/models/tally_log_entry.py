@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, String, Enum as SQLEnum, Index
+from sqlalchemy import Column, Integer, ForeignKey, Float, String, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 import enum
 from ..database import Base
-from .utils import utcnow
+from .utils import UTCDateTime
 
 
 class TallyLogEntryRole(str, enum.Enum):
@@ -20,9 +21,9 @@ class TallyLogEntry(Base):
     weight = Column(Float, nullable=False)
     heads = Column(Float, nullable=True, default=15.0)
     notes = Column(String(500), nullable=True)
-    created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False, index=True)
+    created_at = Column(UTCDateTime, server_default=func.now(), nullable=False, index=True)
     original_session_id = Column(Integer, ForeignKey("tally_sessions.id"), nullable=True, index=True)
-    transferred_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    transferred_at = Column(UTCDateTime, nullable=True, index=True)
 
     # Relationships
     tally_session = relationship(
@@ -42,5 +43,7 @@ class TallyLogEntry(Base):
         Index('idx_session_role', 'tally_session_id', 'role'),
         Index('idx_session_created', 'tally_session_id', 'created_at'),
         Index('idx_classification', 'weight_classification_id'),
+        # Aggregation key for per-allocation bag counts (session + classification + role)
+        Index('idx_tally_log_session_class_role', 'tally_session_id', 'weight_classification_id', 'role'),
     )
 
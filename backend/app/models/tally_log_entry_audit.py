@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, JSON, Index
+from sqlalchemy import Column, Integer, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from ..database import Base
-from .utils import utcnow
+from .utils import UTCDateTime
 
 
 class TallyLogEntryAudit(Base):
@@ -10,7 +11,7 @@ class TallyLogEntryAudit(Base):
     id = Column(Integer, primary_key=True, index=True)
     tally_log_entry_id = Column(Integer, ForeignKey("tally_log_entries.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    edited_at = Column(DateTime(timezone=True), default=utcnow, nullable=False, index=True)
+    edited_at = Column(UTCDateTime, server_default=func.now(), nullable=False, index=True)
     changes = Column(JSON, nullable=False)  # Stores field changes as JSON: {"field_name": {"old": value, "new": value}}
 
     # Relationships
@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, ForeignKey, Date, String, DateTime, Index, Enum as SQLEnum
+from sqlalchemy import Column, Integer, ForeignKey, Date, String, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 import enum
 from ..database import Base
-from .utils import utcnow
+from .utils import UTCDateTime
 
 
 class TallySessionStatus(str, enum.Enum):
@@ -20,8 +21,8 @@ class TallySession(Base):
     date = Column(Date, nullable=False, index=True)
     status = Column(SQLEnum(TallySessionStatus), nullable=False, default=TallySessionStatus.ONGOING, index=True)
     session_number = Column(Integer, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=utcnow)
-    updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+    created_at = Column(UTCDateTime, server_default=func.now())
+    updated_at = Column(UTCDateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     customer = relationship("Customer", back_populates="tally_sessions")
@@ -39,5 +40,8 @@ class TallySession(Base):
         Index('idx_customer_plant_date', 'customer_id', 'plant_id', 'date'),
         Index('idx_status_date', 'status', 'date'),
         Index('idx_customer_session_number', 'customer_id', 'session_number'),
+        # Covering indexes for list/date endpoints that filter by plant or customer and order by date DESC
+        Index('idx_plant_date', plant_id, date.desc()),
+        Index('idx_customer_date', customer_id, date.desc()),
     )
 
@@ -1,18 +1,10 @@
-"""
-Utility functions for models.
-"""
-from datetime import datetime, timezone
-
-
-def utcnow():
-    """
-    Get current UTC datetime.
-    
-    Returns timezone-naive UTC datetime for SQL Server compatibility.
-    SQL Server DATETIME2 columns don't accept timezone-aware datetimes,
-    so we return a naive datetime in UTC timezone.
-    """
-    # Return timezone-naive UTC datetime for SQL Server compatibility
-    # SQL Server DATETIME2 doesn't handle timezone-aware datetimes well
-    return datetime.utcnow()
-
+"""
+Shared column types for models.
+"""
+from sqlalchemy import DateTime
+from sqlalchemy.dialects import mssql
+
+
+# Naive UTC timestamp column type (values come from the server clock via func.now()).
+# On SQL Server this is DATETIME2(3) rather than the 10-byte DATETIMEOFFSET.
+UTCDateTime = DateTime(timezone=False).with_variant(mssql.DATETIME2(precision=3), "mssql")
@@ -1,76 +1,61 @@
-from .customer import CustomerCreate, CustomerUpdate, CustomerResponse
-from .plant import PlantCreate, PlantUpdate, PlantResponse
-from .weight_classification import (
-    WeightClassificationCreate,
-    WeightClassificationUpdate,
-    WeightClassificationResponse,
-)
-from .tally_session import (
-    TallySessionCreate,
-    TallySessionUpdate,
-    TallySessionResponse,
-)
-from .allocation_details import (
-    AllocationDetailsCreate,
-    AllocationDetailsUpdate,
-    AllocationDetailsResponse,
-    AllocationDetailsMinimalResponse,
-)
-from .tally_log_entry import (
-    TallyLogEntryCreate,
-    TallyLogEntryResponse,
-)
-from .export import ExportRequest, ExportResponse
-from .user import (
-    UserCreate,
-    UserUpdate,
-    UserResponse,
-    UserDetailResponse,
-    UserLogin,
-    Token,
-    TokenData,
-)
-from .role import (
-    RoleCreate,
-    RoleUpdate,
-    RoleResponse,
-    RoleWithPermissions,
-    AssignPermissionsRequest,
-)
-from .permission import PermissionResponse
+"""
+Pydantic request/response schemas.
 
-__all__ = [
-    "CustomerCreate",
-    "CustomerUpdate",
-    "CustomerResponse",
-    "PlantCreate",
-    "PlantUpdate",
-    "PlantResponse",
-    "WeightClassificationCreate",
-    "WeightClassificationUpdate",
-    "WeightClassificationResponse",
-    "TallySessionCreate",
-    "TallySessionUpdate",
-    "TallySessionResponse",
-    "AllocationDetailsCreate",
-    "AllocationDetailsUpdate",
-    "AllocationDetailsResponse",
-    "AllocationDetailsMinimalResponse",
-    "TallyLogEntryCreate",
-    "TallyLogEntryResponse",
-    "ExportRequest",
-    "ExportResponse",
-    "UserCreate",
-    "UserUpdate",
-    "UserResponse",
-    "UserDetailResponse",
-    "UserLogin",
-    "Token",
-    "TokenData",
-    "RoleCreate",
-    "RoleUpdate",
-    "RoleResponse",
-    "RoleWithPermissions",
-    "AssignPermissionsRequest",
-    "PermissionResponse",
-]
+Routers import the submodules they need directly (``from ..schemas.customer import ...``).
+The package-level names below are resolved lazily (PEP 562), so importing one schema
+module doesn't build the validators of every other schema module.
+"""
+import importlib
+
+# Re-exported name -> submodule that defines it
+_EXPORTS = {
+    "CustomerCreate": "customer",
+    "CustomerUpdate": "customer",
+    "CustomerResponse": "customer",
+    "PlantCreate": "plant",
+    "PlantUpdate": "plant",
+    "PlantResponse": "plant",
+    "WeightClassificationCreate": "weight_classification",
+    "WeightClassificationUpdate": "weight_classification",
+    "WeightClassificationResponse": "weight_classification",
+    "TallySessionCreate": "tally_session",
+    "TallySessionUpdate": "tally_session",
+    "TallySessionResponse": "tally_session",
+    "AllocationDetailsCreate": "allocation_details",
+    "AllocationDetailsUpdate": "allocation_details",
+    "AllocationDetailsResponse": "allocation_details",
+    "AllocationDetailsMinimalResponse": "allocation_details",
+    "TallyLogEntryCreate": "tally_log_entry",
+    "TallyLogEntryResponse": "tally_log_entry",
+    "ExportRequest": "export",
+    "ExportResponse": "export",
+    "UserCreate": "user",
+    "UserUpdate": "user",
+    "UserResponse": "user",
+    "UserDetailResponse": "user",
+    "UserLogin": "user",
+    "Token": "user",
+    "TokenData": "user",
+    "RoleCreate": "role",
+    "RoleUpdate": "role",
+    "RoleResponse": "role",
+    "RoleWithPermissions": "role",
+    "AssignPermissionsRequest": "role",
+    "PermissionResponse": "permission",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
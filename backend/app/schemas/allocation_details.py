@@ -1,27 +1,14 @@
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
+from .base import ORM_CONFIG, NonNegFloat, ORMResponseMixin
 
 
 class AllocationDetailsBase(BaseModel):
-    required_bags: float = 0.0
-    allocated_bags_tally: float = 0.0
-    allocated_bags_dispatcher: float = 0.0
-    heads: Optional[float] = 0.0
-
-    @field_validator('required_bags', 'allocated_bags_tally', 'allocated_bags_dispatcher')
-    @classmethod
-    def validate_bags(cls, v):
-        if v < 0:
-            raise ValueError('bags must be non-negative')
-        return v
-
-    @field_validator('heads')
-    @classmethod
-    def validate_heads(cls, v):
-        if v is not None and v < 0:
-            raise ValueError('heads must be non-negative')
-        return v
+    required_bags: NonNegFloat = 0.0
+    allocated_bags_tally: NonNegFloat = 0.0
+    allocated_bags_dispatcher: NonNegFloat = 0.0
+    heads: Optional[NonNegFloat] = 0.0
 
 
 class AllocationDetailsCreate(AllocationDetailsBase):
@@ -31,29 +18,22 @@ class AllocationDetailsCreate(AllocationDetailsBase):
 
 class AllocationDetailsUpdate(BaseModel):
     weight_classification_id: Optional[int] = None
-    required_bags: Optional[float] = None
+    required_bags: Optional[NonNegFloat] = None
     # Note: allocated_bags_tally and allocated_bags_dispatcher are not editable
     # They are automatically calculated from tally log entries
 
-    @field_validator('required_bags')
-    @classmethod
-    def validate_bags(cls, v):
-        if v is not None and v < 0:
-            raise ValueError('bags must be non-negative')
-        return v
-
 
-class AllocationDetailsResponse(AllocationDetailsBase):
+class AllocationDetailsResponse(ORMResponseMixin, AllocationDetailsBase):
     id: int
     tally_session_id: int
     weight_classification_id: int
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
 
-class AllocationDetailsMinimalResponse(BaseModel):
+class AllocationDetailsMinimalResponse(ORMResponseMixin, BaseModel):
     """
     Minimal allocation details for tally operators with only can_tally permission.
     Shows ONLY what needs to be tallied (requirements), without progress/completion data.
@@ -65,4 +45,4 @@ class AllocationDetailsMinimalResponse(BaseModel):
     heads: Optional[float] = 0.0
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
@@ -0,0 +1,38 @@
+from typing import Annotated, Any, ClassVar, Tuple
+
+from pydantic import ConfigDict, Field
+
+# Shared config for schemas read from ORM objects (model_config = ORM_CONFIG).
+# The other flags are pydantic's defaults, pinned here because nested responses
+# (e.g. RoleWithPermissions) rely on embedded models not being re-validated.
+ORM_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra='ignore',
+    populate_by_name=False,
+    validate_assignment=False,
+    revalidate_instances='never',
+)
+
+# Bag/head counts can't be negative; checked by pydantic-core without a Python validator call
+NonNegFloat = Annotated[float, Field(ge=0)]
+
+
+class ORMResponseMixin:
+    """
+    Fast construction of response schemas from ORM rows.
+
+    Rows loaded from the database are already typed and valid, so from_orm_fast()
+    copies the attributes with model_construct() instead of running full validation
+    like model_validate() does. Only use it for flat schemas (no nested models).
+    """
+    _orm_fields: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # model_fields is complete at this point, so build the field list once per class
+        cls._orm_fields = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        return cls.model_construct(**{field: getattr(obj, field) for field in cls._orm_fields})
@@ -1,9 +1,16 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
+from pydantic.dataclasses import dataclass
 from typing import List, Optional, Dict
 from datetime import date
 from ..models.tally_log_entry import TallyLogEntryRole
 
-class ExportItem(BaseModel):
+# Session IDs end up as bind parameters of one IN (...) clause; SQL Server allows at most 2100 per statement
+MAX_EXPORT_SESSION_IDS = 2000
+
+# Small per-row value objects are slotted, frozen pydantic dataclasses: still validated,
+# but without a per-instance __dict__ and fields-set tracking
+@dataclass(frozen=True, slots=True)
+class ExportItem:
     category: str
     classification: str
     bags: float
@@ -20,13 +27,19 @@ class ExportResponse(BaseModel):
     grand_total_fr: float
 
 class ExportRequest(BaseModel):
-    session_ids: List[int] = []
+    session_ids: List[int] = Field(default_factory=list, max_length=MAX_EXPORT_SESSION_IDS)
     date_from: Optional[date] = None
     date_to: Optional[date] = None
     customer_id: Optional[int] = None
     plant_id: Optional[int] = None
     role: Optional[TallyLogEntryRole] = TallyLogEntryRole.TALLY  # Default to TALLY for backward compatibility
 
+    @field_validator('session_ids')
+    @classmethod
+    def dedupe_session_ids(cls, v: List[int]) -> List[int]:
+        # Drop duplicates and sort, so the IN list is stable and lookups follow index order
+        return sorted(set(v))
+
 # Tally Sheet Export Schemas
 class TallySheetEntry(BaseModel):
     """Individual entry in the tally sheet grid"""
@@ -36,13 +49,15 @@ class TallySheetEntry(BaseModel):
     classification: str  # Weight classification code (e.g., "OS", "P4", "US")
     classification_id: int  # Weight classification ID
 
-class TallySheetColumnHeader(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TallySheetColumnHeader:
     """Column header information"""
     classification: str  # Classification code
     classification_id: int  # Classification ID
     index: int  # Column index (0-based)
 
-class TallySheetSummary(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TallySheetSummary:
     """Summary data for a classification"""
     classification: str
     classification_id: int
@@ -74,9 +89,15 @@ class TallySheetPage(BaseModel):
 
 class TallySheetRequest(BaseModel):
     """Request model for tally sheet export"""
-    session_ids: List[int]
+    session_ids: List[int] = Field(max_length=MAX_EXPORT_SESSION_IDS)
     role: Optional[TallyLogEntryRole] = TallyLogEntryRole.TALLY  # Default to TALLY for backward compatibility
 
+    @field_validator('session_ids')
+    @classmethod
+    def dedupe_session_ids(cls, v: List[int]) -> List[int]:
+        # Drop duplicates and sort, so the IN list is stable and lookups follow index order
+        return sorted(set(v))
+
 class TallySheetResponse(BaseModel):
     """Response model for tally sheet export (single customer)"""
     customer_name: str
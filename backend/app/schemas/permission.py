@@ -1,6 +1,7 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
+from .base import ORM_CONFIG, ORMResponseMixin
 
 
 class PermissionBase(BaseModel):
@@ -10,9 +11,9 @@ class PermissionBase(BaseModel):
     category: str
 
 
-class PermissionResponse(PermissionBase):
+class PermissionResponse(ORMResponseMixin, PermissionBase):
     id: int
     created_at: datetime
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
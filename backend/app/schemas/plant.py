@@ -1,6 +1,7 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
+from .base import ORM_CONFIG, ORMResponseMixin
 
 
 class PlantBase(BaseModel):
@@ -15,10 +16,10 @@ class PlantUpdate(BaseModel):
     name: Optional[str] = None
 
 
-class PlantResponse(PlantBase):
+class PlantResponse(ORMResponseMixin, PlantBase):
     id: int
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
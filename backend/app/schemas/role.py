@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 from typing import Optional, List
 from .permission import PermissionResponse
+from .base import ORM_CONFIG
 
 
 class RoleBase(BaseModel):
@@ -25,15 +26,21 @@ class RoleResponse(RoleBase):
     created_at: datetime
     updated_at: datetime
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
 
 class RoleWithPermissions(RoleResponse):
     permissions: List[PermissionResponse] = Field(default_factory=list)
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
 
 class AssignPermissionsRequest(BaseModel):
     permission_ids: List[int] = Field(..., min_items=1)
 
+    @field_validator('permission_ids')
+    @classmethod
+    def sort_unique_permission_ids(cls, v: List[int]) -> List[int]:
+        # Duplicates would violate the role_permissions primary key; sorting gives a stable insert order
+        return sorted(set(v))
+
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, PositiveFloat
 from datetime import datetime
 from typing import Optional, List
 from enum import Enum
+from .base import ORM_CONFIG, NonNegFloat
 
 
 class TallyLogEntryRole(str, Enum):
@@ -10,25 +11,11 @@ class TallyLogEntryRole(str, Enum):
 
 
 class TallyLogEntryBase(BaseModel):
-    weight: float
+    weight: PositiveFloat
     role: TallyLogEntryRole
-    heads: Optional[float] = 15.0  # Note: For Byproduct category items, heads is automatically set to 1.0 regardless of input
+    heads: Optional[NonNegFloat] = 15.0  # Note: For Byproduct category items, heads is automatically set to 1.0 regardless of input
     notes: Optional[str] = None
 
-    @field_validator('weight')
-    @classmethod
-    def validate_weight(cls, v):
-        if v <= 0:
-            raise ValueError('weight must be greater than 0')
-        return v
-
-    @field_validator('heads')
-    @classmethod
-    def validate_heads(cls, v):
-        if v is not None and v < 0:
-            raise ValueError('heads must be non-negative')
-        return v
-
 
 class TallyLogEntryCreate(TallyLogEntryBase):
     tally_session_id: int
@@ -37,27 +24,13 @@ class TallyLogEntryCreate(TallyLogEntryBase):
 
 class TallyLogEntryUpdate(BaseModel):
     """Update schema for tally log entries. All fields are optional."""
-    weight: Optional[float] = None
+    weight: Optional[PositiveFloat] = None
     role: Optional[TallyLogEntryRole] = None
-    heads: Optional[float] = None
+    heads: Optional[NonNegFloat] = None
     notes: Optional[str] = None
     weight_classification_id: Optional[int] = None
     tally_session_id: Optional[int] = None
 
-    @field_validator('weight')
-    @classmethod
-    def validate_weight(cls, v):
-        if v is not None and v <= 0:
-            raise ValueError('weight must be greater than 0')
-        return v
-
-    @field_validator('heads')
-    @classmethod
-    def validate_heads(cls, v):
-        if v is not None and v < 0:
-            raise ValueError('heads must be non-negative')
-        return v
-
 
 class TallyLogEntryResponse(TallyLogEntryBase):
     id: int
@@ -67,7 +40,7 @@ class TallyLogEntryResponse(TallyLogEntryBase):
     original_session_id: Optional[int] = None
     transferred_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
 
 class TallyLogEntryTransfer(BaseModel):
@@ -1,9 +1,14 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 from datetime import datetime
 from typing import Dict, Any, Optional
+# pydantic only accepts typing_extensions.TypedDict on Python < 3.12
+from typing_extensions import TypedDict
+from .base import ORM_CONFIG
 
 
-class ChangeDetail(BaseModel):
+# A TypedDict rather than a model: the stored JSON dicts are validated and returned
+# as-is instead of building one model instance per changed field
+class ChangeDetail(TypedDict):
     """Schema for individual field changes."""
     old: Any
     new: Any
@@ -26,5 +31,5 @@ class TallyLogEntryAuditResponse(BaseModel):
     weight_classification_name: Optional[str] = None
     weight_classification_category: Optional[str] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
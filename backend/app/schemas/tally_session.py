@@ -1,7 +1,8 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 from datetime import datetime, date
 from typing import Optional
 from enum import Enum
+from .base import ORM_CONFIG
 
 
 class TallySessionStatus(str, Enum):
@@ -34,5 +35,5 @@ class TallySessionResponse(TallySessionBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
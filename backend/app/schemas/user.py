@@ -1,10 +1,14 @@
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, field_validator
 from pydantic_core import PydanticCustomError
 from typing import Optional, List, Dict
 from datetime import datetime
 from ..models.user import UserRole
+from .base import ORM_CONFIG
 import re
 
+# Allow standard domains and .local domains for internal use (compiled once, shared by the validators)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$|^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.local$')
+
 
 # Token schemas
 class Token(BaseModel):
@@ -21,8 +25,7 @@ class UserLogin(BaseModel):
     username: str
     password: str
     
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 
 # User creation schema (for superadmin)
@@ -54,9 +57,7 @@ class UserCreate(BaseModel):
                 'Invalid email format'
             )
         
-        # Allow standard domains and .local domains for internal use
-        email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$|^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.local$')
-        if not email_pattern.match(v):
+        if not _EMAIL_RE.match(v):
             raise PydanticCustomError(
                 'value_error',
                 'Invalid email format'
@@ -98,9 +99,7 @@ class UserUpdate(BaseModel):
                 'Invalid email format'
             )
         
-        # Allow standard domains and .local domains for internal use
-        email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$|^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.local$')
-        if not email_pattern.match(v):
+        if not _EMAIL_RE.match(v):
             raise PydanticCustomError(
                 'value_error',
                 'Invalid email format'
@@ -129,7 +128,7 @@ class UserResponse(BaseModel):
     visible_tabs: Optional[List[str]] = None  # List of visible tab names
     classification_order: Optional[Dict[str, List[int]]] = None  # JSON object: { "Dressed": [id1, id2, ...], "Frozen": [...], "Byproduct": [...] }
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
 
 # Detailed user response with plant permissions
@@ -143,7 +142,7 @@ class UserDetailResponse(BaseModel):
     updated_at: datetime
     plant_permissions: List[dict] = Field(default_factory=list)
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
 
 # User preferences update schema
@@ -154,5 +153,5 @@ class UserPreferencesUpdate(BaseModel):
     visible_tabs: Optional[List[str]] = None  # List of visible tab names
     classification_order: Optional[Dict[str, List[int]]] = None  # JSON object: { "Dressed": [id1, id2, ...], "Frozen": [...], "Byproduct": [...] }
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
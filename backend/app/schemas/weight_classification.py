@@ -1,6 +1,7 @@
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from pydantic import BaseModel, model_validator
 from datetime import datetime
 from typing import Optional, Literal
+from .base import ORM_CONFIG, NonNegFloat, ORMResponseMixin
 
 
 # Define allowed category values
@@ -13,23 +14,10 @@ class WeightClassificationBase(BaseModel):
     min_weight: Optional[float] = None  # Nullable for catch-all
     max_weight: Optional[float] = None  # Nullable for "up" ranges and catch-all
     category: CategoryType
-    default_heads: Optional[float] = 15.0  # Default number of heads for this classification
-
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, v: str) -> str:
-        allowed_categories = ['Dressed', 'Byproduct', 'Frozen']
-        if v not in allowed_categories:
-            raise ValueError(f'category must be one of: {", ".join(allowed_categories)}')
-        return v
-    
-    @field_validator('default_heads')
-    @classmethod
-    def validate_default_heads(cls, v: Optional[float]) -> Optional[float]:
-        if v is not None and v < 0:
-            raise ValueError('default_heads must be non-negative')
-        return v
+    default_heads: Optional[NonNegFloat] = 15.0  # Default number of heads for this classification
 
+    # category is checked by the CategoryType Literal and default_heads by its ge=0 constraint,
+    # both inside pydantic-core; only the cross-field rules need a Python validator
     @model_validator(mode='after')
     def validate_description_and_weights(self):
         # Validate description: required for Byproduct, optional for Dressed and Frozen
@@ -39,25 +27,11 @@ class WeightClassificationBase(BaseModel):
             # Skip weight validation for byproducts - they don't have weight ranges
             return self
         
-        # Validate weights for Dressed and Frozen categories (same rules)
-        # Catch-all: both min and max must be null
-        if self.min_weight is None and self.max_weight is None:
-            return self  # Valid catch-all
-        
-        # "Down" range: min_weight is null, max_weight is set (means <= max_weight)
-        if self.min_weight is None and self.max_weight is not None:
-            return self  # Valid "down" range (up to X)
-        
-        # "Up" range: min_weight is set, max_weight is null (means >= min_weight)
-        if self.min_weight is not None and self.max_weight is None:
-            return self  # Valid "up" range (X and up)
-        
-        # Regular range: both min and max are set
-        if self.min_weight is not None and self.max_weight is not None:
-            if self.max_weight < self.min_weight:
-                raise ValueError('max_weight must be greater than or equal to min_weight')
-            return self
-        
+        # Dressed and Frozen: catch-all (both null), "down" (min null), and "up" (max null)
+        # ranges are always valid; a regular range needs max_weight >= min_weight
+        min_weight, max_weight = self.min_weight, self.max_weight
+        if min_weight is not None and max_weight is not None and max_weight < min_weight:
+            raise ValueError('max_weight must be greater than or equal to min_weight')
         return self
 
 
@@ -71,24 +45,7 @@ class WeightClassificationUpdate(BaseModel):
     min_weight: Optional[float] = None
     max_weight: Optional[float] = None
     category: Optional[CategoryType] = None
-    default_heads: Optional[float] = None
-
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        allowed_categories = ['Dressed', 'Byproduct', 'Frozen']
-        if v not in allowed_categories:
-            raise ValueError(f'category must be one of: {", ".join(allowed_categories)}')
-        return v
-    
-    @field_validator('default_heads')
-    @classmethod
-    def validate_default_heads(cls, v: Optional[float]) -> Optional[float]:
-        if v is not None and v < 0:
-            raise ValueError('default_heads must be non-negative')
-        return v
+    default_heads: Optional[NonNegFloat] = None
 
     @model_validator(mode='after')
     def validate_description_and_weights(self):
@@ -100,24 +57,19 @@ class WeightClassificationUpdate(BaseModel):
         if self.category == 'Byproduct':
             return self
         
-        # Only validate weights if at least one weight is being set and category is Dressed or Frozen
-        if self.min_weight is None and self.max_weight is None:
-            return self  # No weights being updated, skip validation
-        
-        # If both are being set, validate the range
-        if self.min_weight is not None and self.max_weight is not None:
-            if self.max_weight < self.min_weight:
-                raise ValueError('max_weight must be greater than or equal to min_weight')
-        
-        # All other combinations are valid (partial updates will be merged with existing data)
+        # Only a range with both bounds set can be checked here; partial updates are
+        # merged with the existing data (and overlap-checked) at the CRUD level
+        min_weight, max_weight = self.min_weight, self.max_weight
+        if min_weight is not None and max_weight is not None and max_weight < min_weight:
+            raise ValueError('max_weight must be greater than or equal to min_weight')
         return self
 
 
-class WeightClassificationResponse(WeightClassificationBase):
+class WeightClassificationResponse(ORMResponseMixin, WeightClassificationBase):
     id: int
     plant_id: int
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ORM_CONFIG
 
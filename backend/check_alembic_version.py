@@ -1,37 +1,45 @@
 #!/usr/bin/env python3
 """
 Quick script to check the current Alembic version in the database.
-Usage: python backend/check_alembic_version.py
+Usage: python backend/check_alembic_version.py [--verbose]
 """
 import sys
 import os
+import argparse
+import traceback
+from urllib.parse import urlsplit
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from app.config import settings
+from app.database import engine
 
-def check_alembic_version():
-    """Check the current Alembic version in the database."""
+def check_alembic_version(verbose: bool = False):
+    """Check the current Alembic version in the database. With verbose, errors include the full traceback."""
     try:
-        print(f"Connecting to database: {settings.database_url.split('@')[-1].split('/')[0] if '@' in settings.database_url else 'local'}")
-        engine = create_engine(settings.database_url)
-        
+        print(f"Connecting to database: {urlsplit(settings.database_url).hostname or 'local'}")
+        # Reuse the app's engine rather than building a second one for a single read
         with engine.connect() as conn:
-            # Check current version
-            result = conn.execute(text('SELECT version_num FROM alembic_version'))
-            current_version = result.scalar()
-            print(f"\n✅ Current Alembic version: {current_version}")
-            
-            # Check if problematic permissions exist (from migration 021)
-            perm_result = conn.execute(
+            # Read the current version and any problematic permissions (from migration 021)
+            # in one round trip; the first column tells the two kinds of row apart
+            result = conn.execute(
                 text("""
-                    SELECT code FROM permissions 
+                    SELECT 'version' AS kind, version_num AS value FROM alembic_version
+                    UNION ALL
+                    SELECT 'permission', code FROM permissions 
                     WHERE code IN ('can_edit_tally_log_entries', 'can_delete_tally_log_entries', 'can_transfer_tally_log_entries')
                 """)
             )
-            existing_perms = [row[0] for row in perm_result.fetchall()]
+            current_version = None
+            existing_perms = []
+            for kind, value in result:
+                if kind == 'version':
+                    current_version = value
+                else:
+                    existing_perms.append(value)
+            print(f"\n✅ Current Alembic version: {current_version}")
             
             if existing_perms:
                 print(f"\n⚠️  WARNING: Found permissions that suggest partial migration:")
@@ -52,9 +60,14 @@ def check_alembic_version():
             
     except Exception as e:
         print(f"\n❌ Error checking version: {e}")
+        if verbose:
+            traceback.print_exc()
         return None, []
 
 if __name__ == "__main__":
-    check_alembic_version()
+    parser = argparse.ArgumentParser(description="Check the current Alembic version in the database.")
+    parser.add_argument("--verbose", action="store_true", help="Print the full traceback on errors")
+    args = parser.parse_args()
+    check_alembic_version(verbose=args.verbose)
 
 
@@ -4,6 +4,9 @@ Helper script to convert Azure SQL ADO.NET connection string to SQLAlchemy forma
 import re
 import urllib.parse
 
+# One "key=value" pair of an ADO.NET connection string, with surrounding whitespace trimmed
+_ADO_PAIR_RE = re.compile(r'\s*([^=;]+?)\s*=\s*([^;]*?)\s*(?:;|$)')
+
 def convert_ado_to_sqlalchemy(ado_string, password=None):
     """
     Convert ADO.NET connection string to SQLAlchemy format
@@ -16,11 +19,7 @@ def convert_ado_to_sqlalchemy(ado_string, password=None):
         SQLAlchemy connection string
     """
     # Parse ADO.NET connection string
-    params = {}
-    for part in ado_string.split(';'):
-        if '=' in part:
-            key, value = part.split('=', 1)
-            params[key.strip()] = value.strip()
+    params = dict(_ADO_PAIR_RE.findall(ado_string))
     
     # Extract values
     server = params.get('Server', '')
@@ -2,14 +2,17 @@
 Quick fix script to assign SUPERADMIN role to existing admin user via RBAC.
 
 Usage:
-    python fix_admin_role.py
+    python fix_admin_role.py [--verbose]
 """
 import sys
+import argparse
+import traceback
 from pathlib import Path
 
 # Add parent directory to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.models import User, UserRole
@@ -17,40 +20,40 @@ from app.models.role import Role
 from app.models.user_role import UserRole as UserRoleModel
 
 
-def fix_admin_role():
-    """Assign SUPERADMIN role to admin user if missing."""
+def fix_admin_role(verbose: bool = False):
+    """Assign SUPERADMIN role to admin user if missing. With verbose, errors include the full traceback."""
     db = SessionLocal()
     
     try:
-        # Find admin user
-        admin_user = db.query(User).filter(User.username == 'admin').first()
+        # Find the admin user, the SUPERADMIN role and any existing assignment in one query;
+        # outer joins keep the user row when the role or the assignment is missing
+        row = db.query(User, Role.id, UserRoleModel.id).select_from(User).outerjoin(
+            Role, Role.name == 'SUPERADMIN'
+        ).outerjoin(
+            UserRoleModel,
+            and_(UserRoleModel.user_id == User.id, UserRoleModel.role_id == Role.id)
+        ).filter(User.username == 'admin').first()
         
-        if not admin_user:
+        if not row:
             print("✗ Admin user not found!")
             return False
         
-        # Find SUPERADMIN role
-        superadmin_role = db.query(Role).filter(Role.name == 'SUPERADMIN').first()
+        admin_user, superadmin_role_id, existing_user_role_id = row
         
-        if not superadmin_role:
+        if superadmin_role_id is None:
             print("✗ SUPERADMIN role not found in database!")
             print("  Make sure migrations have been run.")
             return False
         
         # Check if role is already assigned
-        existing_user_role = db.query(UserRoleModel).filter(
-            UserRoleModel.user_id == admin_user.id,
-            UserRoleModel.role_id == superadmin_role.id
-        ).first()
-        
-        if existing_user_role:
+        if existing_user_role_id is not None:
             print("✓ Admin user already has SUPERADMIN role assigned.")
             return True
         
         # Assign the role
         user_role = UserRoleModel(
             user_id=admin_user.id,
-            role_id=superadmin_role.id
+            role_id=superadmin_role_id
         )
         db.add(user_role)
         
@@ -71,8 +74,8 @@ def fix_admin_role():
         
     except Exception as e:
         print(f"✗ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if verbose:
+            traceback.print_exc()
         db.rollback()
         return False
     finally:
@@ -80,8 +83,12 @@ def fix_admin_role():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Assign the SUPERADMIN role to the admin user.")
+    parser.add_argument("--verbose", action="store_true", help="Print the full traceback on errors")
+    args = parser.parse_args()
+    
     print("\n🔧 Fix Admin Role Script\n")
-    success = fix_admin_role()
+    success = fix_admin_role(verbose=args.verbose)
     if success:
         print("\n✓ Script completed successfully!\n")
     else:
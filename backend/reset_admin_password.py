@@ -4,11 +4,13 @@ Reset admin password script.
 This script resets the admin user's password to the default: admin123
 
 Usage:
-    python reset_admin_password.py [new_password]
+    python reset_admin_password.py [new_password] [--verbose]
 
 If no password is provided, it will reset to the default: admin123
 """
 import sys
+import argparse
+import traceback
 from pathlib import Path
 
 # Add parent directory to path to allow imports
@@ -23,10 +25,12 @@ from app.auth.password import hash_password
 def reset_admin_password(db: Session, new_password: str = "admin123"):
     """Reset the admin user's password."""
     
-    # Find admin user by username or superadmin role
-    admin_user = db.query(User).filter(
-        (User.username == "admin") | (User.role == UserRole.SUPERADMIN)
-    ).first()
+    # Find admin user by username (unique index seek), falling back to any superadmin;
+    # an OR across both columns can't use either index
+    admin_user = (
+        db.query(User).filter(User.username == "admin").first()
+        or db.query(User).filter(User.role == UserRole.SUPERADMIN).first()
+    )
     
     if not admin_user:
         print("❌ No admin user found!")
@@ -54,8 +58,11 @@ def main():
     """Main function."""
     print("\n🔐 Tally System - Admin Password Reset\n")
     
-    # Get new password from command line argument if provided
-    new_password = sys.argv[1] if len(sys.argv) > 1 else "admin123"
+    parser = argparse.ArgumentParser(description="Reset the admin user's password.")
+    parser.add_argument("new_password", nargs="?", default="admin123", help="New password (default: admin123)")
+    parser.add_argument("--verbose", action="store_true", help="Print the full traceback on errors")
+    args = parser.parse_args()
+    new_password = args.new_password
     
     if len(new_password) < 6:
         print("❌ Error: Password must be at least 6 characters long!")
@@ -72,8 +79,8 @@ def main():
         
     except Exception as e:
         print(f"\n❌ Error resetting password: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if args.verbose:
+            traceback.print_exc()
         sys.exit(1)
 
 
@@ -2,28 +2,51 @@
 """
 Direct migration runner that bypasses Alembic's ConfigParser issues.
 Run this script to apply migrations directly.
+
+Usage: python run_migrations.py [--verbose]
 """
 import sys
 import os
+import argparse
+import traceback
+from urllib.parse import urlsplit
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from alembic import command
 from alembic.config import Config
-from app.config import settings
 
-# Create Alembic config
-alembic_cfg = Config()
 
-# Set the script location
-alembic_cfg.set_main_option("script_location", "alembic")
+def main():
+    """Upgrade the database to the latest migration."""
+    # Imported here so importing this module doesn't load settings or touch the database
+    from app.config import settings
+
+    # Create Alembic config
+    alembic_cfg = Config()
+
+    # Set the script location
+    alembic_cfg.set_main_option("script_location", "alembic")
+
+    # Set the database URL directly via attributes to bypass ConfigParser interpolation
+    alembic_cfg.attributes['sqlalchemy.url'] = settings.database_url
+
+    # Run migrations
+    print(f"Running migrations with database: {urlsplit(settings.database_url).hostname or 'local'}")
+    command.upgrade(alembic_cfg, "head")
+    print("Migrations completed successfully!")
 
-# Set the database URL directly via attributes to bypass ConfigParser interpolation
-alembic_cfg.attributes['sqlalchemy.url'] = settings.database_url
 
-# Run migrations
-print(f"Running migrations with database: {settings.database_url.split('@')[-1].split('/')[0] if '@' in settings.database_url else 'local'}")
-command.upgrade(alembic_cfg, "head")
-print("Migrations completed successfully!")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Upgrade the database to the latest migration.")
+    parser.add_argument("--verbose", action="store_true", help="Print the full traceback on errors")
+    args = parser.parse_args()
 
+    try:
+        main()
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        if args.verbose:
+            traceback.print_exc()
+        sys.exit(1)
@@ -2,19 +2,21 @@
 Seed script to create a default superadmin user.
 
 Usage:
-    python -m backend.seed_admin
+    python -m backend.seed_admin [--verbose]
 
 Or from the backend directory:
-    python seed_admin.py
+    python seed_admin.py [--verbose]
 """
 import sys
+import argparse
+import traceback
 from pathlib import Path
 
 # Add parent directory to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy.orm import Session
-from app.database import SessionLocal, engine, Base
+from app.database import SessionLocal, create_missing_tables
 from app.models import User, UserRole
 from app.models.role import Role
 from app.models.user_role import UserRole as UserRoleModel
@@ -28,6 +30,9 @@ def create_default_superadmin(db: Session):
     default_email = "admin@tallysystem.local"
     default_password = "admin123"
     
+    # RBAC role used by every branch below; look it up once
+    superadmin_role = db.query(Role).filter(Role.name == 'SUPERADMIN').first()
+    
     # Check if any superadmin exists
     existing_superadmin = db.query(User).filter(User.role == UserRole.SUPERADMIN).first()
     
@@ -36,7 +41,6 @@ def create_default_superadmin(db: Session):
         existing_superadmin.hashed_password = hash_password(default_password)
         
         # Ensure SUPERADMIN role is assigned via RBAC
-        superadmin_role = db.query(Role).filter(Role.name == 'SUPERADMIN').first()
         if superadmin_role:
             # Check if role is already assigned
             existing_user_role = db.query(UserRoleModel).filter(
@@ -62,7 +66,6 @@ def create_default_superadmin(db: Session):
     existing_user = db.query(User).filter(User.username == default_username).first()
     if existing_user:
         # If user exists, try to assign SUPERADMIN role if missing
-        superadmin_role = db.query(Role).filter(Role.name == 'SUPERADMIN').first()
         if superadmin_role:
             # Check if role is already assigned
             existing_user_role = db.query(UserRoleModel).filter(
@@ -71,8 +74,9 @@ def create_default_superadmin(db: Session):
             ).first()
             
             if not existing_user_role:
-                # Update legacy role field and assign RBAC role
+                # Update legacy role field, password and assign RBAC role in one commit
                 existing_user.role = UserRole.SUPERADMIN
+                existing_user.hashed_password = hash_password(default_password)
                 user_role = UserRoleModel(
                     user_id=existing_user.id,
                     role_id=superadmin_role.id
@@ -81,8 +85,6 @@ def create_default_superadmin(db: Session):
                 db.commit()
                 print(f"✓ User '{default_username}' found and SUPERADMIN role assigned!")
                 print(f"✓ Password updated to default: {default_password}")
-                existing_user.hashed_password = hash_password(default_password)
-                db.commit()
                 return existing_user
             else:
                 # Role already assigned, just update password
@@ -110,7 +112,6 @@ def create_default_superadmin(db: Session):
     db.flush()  # Flush to get the user ID
     
     # Assign SUPERADMIN role via RBAC system
-    superadmin_role = db.query(Role).filter(Role.name == 'SUPERADMIN').first()
     if superadmin_role:
         user_role = UserRoleModel(
             user_id=superadmin.id,
@@ -123,7 +124,6 @@ def create_default_superadmin(db: Session):
         print("   Make sure migrations have been run.")
     
     db.commit()
-    db.refresh(superadmin)
     
     print("=" * 60)
     print("✓ Default superadmin user created successfully!")
@@ -140,12 +140,16 @@ def create_default_superadmin(db: Session):
 
 def main():
     """Main function to run the seed script."""
+    parser = argparse.ArgumentParser(description="Create the default superadmin user.")
+    parser.add_argument("--verbose", action="store_true", help="Print the full traceback on errors")
+    args = parser.parse_args()
+    
     print("\n🌱 Tally System - Superadmin Seed Script\n")
     
     try:
         # Create tables if they don't exist
         print("Ensuring database tables exist...")
-        Base.metadata.create_all(bind=engine)
+        create_missing_tables()
         print("✓ Database tables ready\n")
         
         # Create database session
@@ -162,8 +166,8 @@ def main():
         
     except Exception as e:
         print(f"\n✗ Error running seed script: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if args.verbose:
+            traceback.print_exc()
         sys.exit(1)
 
 
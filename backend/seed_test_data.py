@@ -20,10 +20,11 @@ from typing import List, Optional, Tuple
 # Add parent directory to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
-from app.database import SessionLocal, engine, Base
+from app.database import SessionLocal, create_missing_tables
 from app.config import settings
-from app.models import Customer, Plant, WeightClassification, TallySession, AllocationDetails
+from app.models import Customer, Plant, WeightClassification, TallySession, AllocationDetails, TallyLogEntry, TallyLogEntryAudit
 from app.models.tally_session import TallySessionStatus
 from app.crud import (
     customer as customer_crud,
@@ -34,7 +35,6 @@ from app.crud import (
 )
 from app.schemas.customer import CustomerCreate
 from app.schemas.plant import PlantCreate
-from app.schemas.weight_classification import WeightClassificationCreate
 from app.schemas.tally_session import TallySessionCreate
 from app.schemas.allocation_details import AllocationDetailsCreate
 from faker import Faker
@@ -61,6 +61,17 @@ BYPRODUCT_CLASSIFICATIONS = [
     {"classification": "BLD", "description": "Blood"},
 ]
 
+TEST_PLANT_NAME = "Test Plant"
+
+# Rows per bulk INSERT/commit; keeps each transaction bounded on large seeds
+DEFAULT_BATCH_SIZE = 10000
+
+
+def chunked(items: list, size: int):
+    """Yield consecutive slices of items with at most size elements each."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 
 def is_production_environment() -> bool:
     """Check if the current environment appears to be production."""
@@ -104,13 +115,12 @@ def check_production_safety(force: bool = False, clear_existing: bool = False) -
 def clear_existing_test_data(db: Session) -> dict:
     """
     Clear existing test data (customers and their associated sessions/allocations).
-    This will cascade delete all tally sessions and allocation details for deleted customers.
+    Every customer is removed, so every tally session goes with them, along with the
+    sessions' log entries and allocation details.
     
     Returns a dictionary with counts of deleted items.
     """
-    # Get all customers
-    customers = customer_crud.get_customers(db, skip=0, limit=10000)
-    customer_count = len(customers)
+    customer_count = db.query(func.count(Customer.id)).scalar()
     
     if customer_count == 0:
         print("\nNo existing test data to clear.")
@@ -121,59 +131,44 @@ def clear_existing_test_data(db: Session) -> dict:
         }
     
     # Count sessions and allocations before deletion (for reporting)
-    session_count = 0
-    allocation_count = 0
+    session_count = db.query(func.count(TallySession.id)).scalar()
+    allocation_count = db.query(func.count(AllocationDetails.id)).scalar()
     
-    for customer in customers:
-        # Count sessions for this customer
-        sessions = db.query(TallySession).filter(TallySession.customer_id == customer.id).all()
-        session_count += len(sessions)
-        
-        # Count allocations for these sessions
-        for session in sessions:
-            allocations = db.query(AllocationDetails).filter(
-                AllocationDetails.tally_session_id == session.id
-            ).all()
-            allocation_count += len(allocations)
-    
-    # Delete all customers (cascade will handle sessions and allocations)
     print(f"\nClearing existing test data...")
     print(f"  Found {customer_count} customers, {session_count} sessions, {allocation_count} allocations")
     
-    deleted_customers = 0
-    for customer in customers:
-        try:
-            # Delete customer directly - SQLAlchemy cascade will handle sessions and allocations
-            # We bypass the CRUD function which prevents deletion when sessions exist
-            db.delete(customer)
-            db.commit()
-            deleted_customers += 1
-            print(f"  ✓ Deleted customer: {customer.name}")
-        except Exception as e:
-            print(f"  ✗ Failed to delete customer {customer.name}: {str(e)}")
-            db.rollback()
+    try:
+        # One DELETE per table in a single transaction, children first, instead of loading
+        # each customer's sessions and allocations and deleting them row by row.
+        # Audit rows are deleted explicitly: SQLite doesn't enforce the FK's ON DELETE CASCADE.
+        db.query(TallyLogEntryAudit).delete(synchronize_session=False)
+        db.query(TallyLogEntry).delete(synchronize_session=False)
+        deleted_allocations = db.query(AllocationDetails).delete(synchronize_session=False)
+        deleted_sessions = db.query(TallySession).delete(synchronize_session=False)
+        deleted_customers = db.query(Customer).delete(synchronize_session=False)
+        db.commit()
+    except Exception as e:
+        print(f"  ✗ Failed to clear test data: {str(e)}")
+        db.rollback()
+        return {
+            "customers_deleted": 0,
+            "sessions_deleted": 0,
+            "allocations_deleted": 0
+        }
     
-    print(f"\n✓ Cleared {deleted_customers} customers (and their associated sessions/allocations)")
+    print(f"\n✓ Cleared {deleted_customers} customers, {deleted_sessions} sessions and {deleted_allocations} allocations")
     
     return {
         "customers_deleted": deleted_customers,
-        "sessions_deleted": session_count,
-        "allocations_deleted": allocation_count
+        "sessions_deleted": deleted_sessions,
+        "allocations_deleted": deleted_allocations
     }
 
 
 def ensure_test_plant_and_classifications(db: Session) -> Plant:
     """Ensure a test plant exists with standard weight classifications."""
-    TEST_PLANT_NAME = "Test Plant"
-    
     # Check if test plant already exists
-    all_plants = plant_crud.get_plants(db, skip=0, limit=100)
-    test_plant = None
-    
-    for plant in all_plants:
-        if plant.name == TEST_PLANT_NAME:
-            test_plant = plant
-            break
+    test_plant = plant_crud.get_plant_by_name(db, TEST_PLANT_NAME)
     
     if not test_plant:
         print(f"Creating test plant: {TEST_PLANT_NAME}...")
@@ -182,78 +177,126 @@ def ensure_test_plant_and_classifications(db: Session) -> Plant:
     else:
         print(f"✓ Found existing test plant: {test_plant.name}")
     
-    # Ensure the test plant has the standard weight classifications
-    existing_wcs = weight_classification_crud.get_weight_classifications_by_plant(db, test_plant.id)
-    existing_classifications = {wc.classification for wc in existing_wcs}
-    
-    # Create Dressed classifications
-    for dc in DRESSED_CLASSIFICATIONS:
-        if dc["classification"] not in existing_classifications:
-            try:
-                wc = weight_classification_crud.create_weight_classification(
-                    db,
-                    WeightClassificationCreate(
-                        plant_id=test_plant.id,
-                        classification=dc["classification"],
-                        min_weight=dc["min_weight"],
-                        max_weight=dc["max_weight"],
-                        description=dc["description"],
-                        category="Dressed"
-                    )
-                )
-                print(f"  ✓ Created Dressed classification: {wc.classification} for {test_plant.name}")
-            except Exception as e:
-                print(f"  ⚠️  Could not create {dc['classification']}: {str(e)}")
-    
-    # Create Byproduct classifications
-    for bp in BYPRODUCT_CLASSIFICATIONS:
-        if bp["classification"] not in existing_classifications:
-            try:
-                wc = weight_classification_crud.create_weight_classification(
-                    db,
-                    WeightClassificationCreate(
-                        plant_id=test_plant.id,
-                        classification=bp["classification"],
-                        description=bp["description"],
-                        min_weight=None,
-                        max_weight=None,
-                        category="Byproduct"
-                    )
-                )
-                print(f"  ✓ Created Byproduct classification: {wc.classification} ({wc.description}) for {test_plant.name}")
-            except Exception as e:
-                print(f"  ⚠️  Could not create {bp['classification']}: {str(e)}")
+    # Ensure the test plant has the standard weight classifications,
+    # loading the (category, classification) pairs it already has in one query
+    existing_pairs = set(
+        db.query(WeightClassification.category, WeightClassification.classification)
+        .filter(WeightClassification.plant_id == test_plant.id)
+        .all()
+    )
+    
+    rows = [
+        {
+            "plant_id": test_plant.id,
+            "classification": dc["classification"],
+            "min_weight": dc["min_weight"],
+            "max_weight": dc["max_weight"],
+            "description": dc["description"],
+            "category": "Dressed",
+        }
+        for dc in DRESSED_CLASSIFICATIONS
+        if ("Dressed", dc["classification"]) not in existing_pairs
+    ] + [
+        {
+            "plant_id": test_plant.id,
+            "classification": bp["classification"],
+            "min_weight": None,
+            "max_weight": None,
+            "description": bp["description"],
+            "category": "Byproduct",
+        }
+        for bp in BYPRODUCT_CLASSIFICATIONS
+        if ("Byproduct", bp["classification"]) not in existing_pairs
+    ]
+    
+    # The templates don't overlap, so all missing rows go in as one INSERT and one commit
+    if rows:
+        db.execute(insert(WeightClassification), rows)
+        db.commit()
+    
+    for row in rows:
+        if row["category"] == "Byproduct":
+            print(f"  ✓ Created Byproduct classification: {row['classification']} ({row['description']}) for {test_plant.name}")
+        else:
+            print(f"  ✓ Created Dressed classification: {row['classification']} for {test_plant.name}")
     
     return test_plant
 
 
-def generate_customers(db: Session, count: int, fake: Faker) -> List[Customer]:
-    """Generate test customers using Faker."""
-    customers = []
-    existing_customers = customer_crud.get_customers(db, skip=0, limit=1000)
-    existing_names = {c.name for c in existing_customers}
+def template_classifications(plant_id: int) -> List[WeightClassification]:
+    """
+    Unsaved weight classifications built from the templates, with sequential IDs.
+    Stand-ins for the test plant's classifications in --dry-run, which never queries the database.
+    """
+    templates = (
+        [(dc, "Dressed") for dc in DRESSED_CLASSIFICATIONS]
+        + [(bp, "Byproduct") for bp in BYPRODUCT_CLASSIFICATIONS]
+    )
+    return [
+        WeightClassification(
+            id=wc_id,
+            plant_id=plant_id,
+            classification=template["classification"],
+            description=template["description"],
+            min_weight=template.get("min_weight"),
+            max_weight=template.get("max_weight"),
+            category=category
+        )
+        for wc_id, (template, category) in enumerate(templates, start=1)
+    ]
+
+
+def generate_customers(
+    db: Session,
+    count: int,
+    fake: Faker,
+    dry_run: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> List[Customer]:
+    """Generate test customers using Faker. With dry_run, returns unsaved customers instead of inserting."""
+    existing_names = set()
+    if not dry_run:
+        existing_customers = customer_crud.get_customers(db, skip=0, limit=1000)
+        existing_names = {c.name for c in existing_customers}
     
     print(f"\nGenerating {count} customers...")
-    for i in range(count):
-        # Generate unique customer name
-        max_attempts = 100
-        for attempt in range(max_attempts):
-            name = fake.company()
+    # Draw unique names in batches, topping up only the shortfall each round. Names are
+    # kept in draw order (not set order) so --seed stays reproducible.
+    names = []
+    max_rounds = 10
+    for _ in range(max_rounds):
+        if len(names) >= count:
+            break
+        for name in [fake.company() for _ in range(count - len(names) + 32)]:
             if name not in existing_names:
-                break
-        else:
-            # Fallback if we can't generate unique name
-            name = f"{fake.company()} {fake.random_int(min=1000, max=9999)}"
-        
-        existing_names.add(name)
-        
-        try:
-            customer = customer_crud.create_customer(db, CustomerCreate(name=name))
-            customers.append(customer)
-            print(f"  ✓ Created customer: {customer.name}")
-        except Exception as e:
-            print(f"  ⚠️  Could not create customer: {str(e)}")
+                existing_names.add(name)
+                names.append(name)
+    del names[count:]
+    
+    # Fallback if Faker runs out of unique company names
+    while len(names) < count:
+        name = f"{fake.company()} {fake.random_int(min=1000, max=9999)}"
+        if name not in existing_names:
+            existing_names.add(name)
+            names.append(name)
+    
+    new_customers = [CustomerCreate(name=name) for name in names]
+    
+    if dry_run:
+        print(f"  ○ Built {len(new_customers)} customers (dry run, not inserted)")
+        return [Customer(id=customer_id, **customer.model_dump()) for customer_id, customer in enumerate(new_customers, start=1)]
+    
+    # Insert customers in batched statements (one commit per batch) rather than one INSERT and commit each
+    customers = []
+    try:
+        for batch in chunked(new_customers, batch_size):
+            customers.extend(customer_crud.create_customers_bulk(db, batch))
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"  ⚠️  Could not create customers: {str(e)}")
     
+    print(f"  ✓ Created {len(customers)} customers")
     return customers
 
 
@@ -262,10 +305,12 @@ def generate_tally_sessions(
     customers: List[Customer],
     test_plant: Plant,
     sessions_per_customer: int,
-    fake: Faker
+    fake: Faker,
+    dry_run: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE
 ) -> List[TallySession]:
-    """Generate tally sessions for customers using the test plant."""
-    sessions = []
+    """Generate tally sessions for customers using the test plant. With dry_run, returns unsaved sessions."""
+    new_sessions = []
     statuses = [TallySessionStatus.ONGOING, TallySessionStatus.COMPLETED, TallySessionStatus.CANCELLED]
     
     print(f"\nGenerating tally sessions ({sessions_per_customer} per customer) for {test_plant.name}...")
@@ -281,48 +326,64 @@ def generate_tally_sessions(
                 weights=[40, 50, 10]  # 40% ongoing, 50% completed, 10% cancelled
             )[0]
             
-            try:
-                session = tally_session_crud.create_tally_session(
-                    db,
-                    TallySessionCreate(
-                        customer_id=customer.id,
-                        plant_id=test_plant.id,
-                        date=session_date,
-                        status=status
-                    )
-                )
-                sessions.append(session)
-                print(f"  ✓ Created session #{session.session_number} for {customer.name} on {session_date} ({status.value})")
-            except Exception as e:
-                print(f"  ⚠️  Could not create session: {str(e)}")
+            new_sessions.append(TallySessionCreate(
+                customer_id=customer.id,
+                plant_id=test_plant.id,
+                date=session_date,
+                status=status
+            ))
+    
+    if dry_run:
+        print(f"  ○ Built {len(new_sessions)} sessions (dry run, not inserted)")
+        return [TallySession(id=session_id, **session.model_dump()) for session_id, session in enumerate(new_sessions, start=1)]
     
+    # Insert sessions in batched statements (one commit per batch) rather than one INSERT and commit each
+    sessions = []
+    try:
+        for batch in chunked(new_sessions, batch_size):
+            sessions.extend(tally_session_crud.create_tally_sessions_bulk(db, batch))
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"  ⚠️  Could not create sessions: {str(e)}")
+    
+    print(f"  ✓ Created {len(sessions)} sessions")
     return sessions
 
 
 def generate_allocations(
     db: Session,
     sessions: List[TallySession],
-    fake: Faker
-) -> List[AllocationDetails]:
-    """Generate allocation details for tally sessions."""
-    allocations = []
+    fake: Faker,
+    dry_run: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Generate allocation details for tally sessions. Returns the number created (or built, with dry_run)."""
+    new_allocations = []
     
     # Valid bag counts in increments of 5: 5, 10, 15, 20, 25
     valid_bag_counts = [5, 10, 15, 20, 25]
     
+    # Load and split each plant's classifications once instead of once per session
+    wcs_by_plant = {}
+    for plant_id in {session.plant_id for session in sessions}:
+        if dry_run:
+            weight_classifications = template_classifications(plant_id)
+        else:
+            weight_classifications = weight_classification_crud.get_weight_classifications_by_plant(db, plant_id)
+        wcs_by_plant[plant_id] = (
+            [wc for wc in weight_classifications if wc.category == "Dressed"],
+            [wc for wc in weight_classifications if wc.category == "Byproduct"],
+        )
+    
     print(f"\nGenerating allocation details (minimum 3 Dressed + 3 Byproduct per session)...")
     for session in sessions:
-        # Get weight classifications for this session's plant
-        weight_classifications = weight_classification_crud.get_weight_classifications_by_plant(db, session.plant_id)
+        dressed_wcs, byproduct_wcs = wcs_by_plant[session.plant_id]
         
-        if not weight_classifications:
+        if not dressed_wcs and not byproduct_wcs:
             print(f"  ⚠️  No weight classifications found for plant {session.plant_id}, skipping session {session.id}")
             continue
         
-        # Separate classifications by category
-        dressed_wcs = [wc for wc in weight_classifications if wc.category == "Dressed"]
-        byproduct_wcs = [wc for wc in weight_classifications if wc.category == "Byproduct"]
-        
         selected_wcs = []
         
         # Select at least 3 Dressed classifications (or all if less than 3 available)
@@ -346,28 +407,32 @@ def generate_allocations(
             # Random bag count from valid increments: 5, 10, 15, 20, 25
             required_bags = random.choice(valid_bag_counts)
             
-            try:
-                allocation = allocation_details_crud.create_allocation_detail(
-                    db,
-                    AllocationDetailsCreate(
-                        tally_session_id=session.id,
-                        weight_classification_id=wc.id,
-                        required_bags=float(required_bags),
-                        allocated_bags_tally=0.0,
-                        allocated_bags_dispatcher=0.0,
-                        heads=0.0
-                    )
-                )
-                allocations.append(allocation)
-                print(f"  ✓ Created allocation: {wc.classification} ({wc.category}) - {required_bags} bags required")
-            except Exception as e:
-                # Allocation might already exist (unique constraint)
-                if "already exists" in str(e).lower():
-                    print(f"  ⚠️  Allocation already exists for session {session.id} and {wc.classification}")
-                else:
-                    print(f"  ⚠️  Could not create allocation: {str(e)}")
-    
-    return allocations
+            new_allocations.append(AllocationDetailsCreate(
+                tally_session_id=session.id,
+                weight_classification_id=wc.id,
+                required_bags=float(required_bags),
+                allocated_bags_tally=0.0,
+                allocated_bags_dispatcher=0.0,
+                heads=0.0
+            ))
+    
+    if dry_run:
+        print(f"  ○ Built {len(new_allocations)} allocations (dry run, not inserted)")
+        return len(new_allocations)
+    
+    # The sessions are new and each classification is sampled once per session, so no
+    # (session, classification) pair can already exist; insert them in batches
+    allocation_count = 0
+    try:
+        for batch in chunked(new_allocations, batch_size):
+            allocation_count += allocation_details_crud.create_allocation_details_bulk(db, batch)
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"  ⚠️  Could not create allocations: {str(e)}")
+    
+    print(f"  ✓ Created {allocation_count} allocations")
+    return allocation_count
 
 
 def main():
@@ -409,9 +474,23 @@ def main():
         action="store_true",
         help="Clear existing test data (customers, sessions, allocations) before generating new data. Disabled in production."
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rows per bulk insert and commit (default: {DEFAULT_BATCH_SIZE}; around 1000 suits PostgreSQL)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Generate all rows in memory without reading or writing the database (for profiling the generation code)"
+    )
     
     args = parser.parse_args()
     
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    
     print("\n" + "=" * 80)
     print("🌱 Tally System - Test Data Seed Script")
     print("=" * 80)
@@ -434,41 +513,56 @@ def main():
         random.seed(args.seed)
         print(f"Using random seed: {args.seed}\n")
     
+    if args.dry_run:
+        print("Dry run: rows are generated in memory only; the database is not touched.\n")
+        if args.clear_existing:
+            print("⚠️  --clear-existing is ignored with --dry-run.\n")
+    
     try:
-        # Create tables if they don't exist
-        print("Ensuring database tables exist...")
-        Base.metadata.create_all(bind=engine)
-        print("✓ Database tables ready\n")
+        if not args.dry_run:
+            # Create tables if they don't exist
+            print("Ensuring database tables exist...")
+            create_missing_tables()
+            print("✓ Database tables ready\n")
         
-        # Create database session
-        db = SessionLocal()
-        fake = Faker()
+        # Create database session (a dry run never opens one)
+        db = None if args.dry_run else SessionLocal()
+        # Only company names are generated; en_US company formats also need person's last_name.
+        # Loading just these two providers skips building the full default provider table.
+        fake = Faker(providers=["faker.providers.company", "faker.providers.person"])
         
         if args.seed is not None:
             Faker.seed(args.seed)
         
         try:
-            # Clear existing test data if requested
-            if args.clear_existing:
-                clear_existing_test_data(db)
+            if args.dry_run:
+                # Unsaved stand-in; allocations use template_classifications() for it
+                test_plant = Plant(id=1, name=TEST_PLANT_NAME)
+            else:
+                # Clear existing test data if requested
+                if args.clear_existing:
+                    clear_existing_test_data(db)
+                    print()
+                
+                # Ensure test plant and weight classifications exist
+                print("Ensuring test plant and weight classifications exist...")
+                test_plant = ensure_test_plant_and_classifications(db)
                 print()
             
-            # Ensure test plant and weight classifications exist
-            print("Ensuring test plant and weight classifications exist...")
-            test_plant = ensure_test_plant_and_classifications(db)
-            print()
-            
             # Generate customers
-            customers = generate_customers(db, args.customers, fake)
+            customers = generate_customers(db, args.customers, fake, dry_run=args.dry_run, batch_size=args.batch_size)
             print(f"\n✓ Generated {len(customers)} customers")
             
             # Generate tally sessions (all using the test plant)
-            sessions = generate_tally_sessions(db, customers, test_plant, args.sessions_per_customer, fake)
+            sessions = generate_tally_sessions(
+                db, customers, test_plant, args.sessions_per_customer, fake,
+                dry_run=args.dry_run, batch_size=args.batch_size
+            )
             print(f"\n✓ Generated {len(sessions)} tally sessions")
             
             # Generate allocations
-            allocations = generate_allocations(db, sessions, fake)
-            print(f"\n✓ Generated {len(allocations)} allocation details")
+            allocation_count = generate_allocations(db, sessions, fake, dry_run=args.dry_run, batch_size=args.batch_size)
+            print(f"\n✓ Generated {allocation_count} allocation details")
             
             # Summary
             print("\n" + "=" * 80)
@@ -477,11 +571,12 @@ def main():
             print(f"Summary:")
             print(f"  - Customers: {len(customers)}")
             print(f"  - Tally Sessions: {len(sessions)}")
-            print(f"  - Allocation Details: {len(allocations)}")
+            print(f"  - Allocation Details: {allocation_count}")
             print("=" * 80 + "\n")
             
         finally:
-            db.close()
+            if db is not None:
+                db.close()
         
     except Exception as e:
         print(f"\n✗ Error running seed script: {str(e)}")
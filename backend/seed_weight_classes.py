@@ -15,13 +15,10 @@ from pathlib import Path
 # Add parent directory to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
-from app.database import SessionLocal, engine, Base
-from app.crud import (
-    plant as plant_crud,
-    weight_classification as weight_classification_crud,
-)
-from app.schemas.weight_classification import WeightClassificationCreate
+from app.database import SessionLocal, create_missing_tables
+from app.models import Plant, WeightClassification
 
 
 # Standard Weight Classification Templates
@@ -48,11 +45,21 @@ BYPRODUCT_CLASSIFICATIONS = [
 
 def find_plant_by_name(db: Session, plant_name: str):
     """Find a plant by name (case-insensitive)."""
-    all_plants = plant_crud.get_plants(db, skip=0, limit=1000)
-    for plant in all_plants:
-        if plant.name.lower() == plant_name.lower():
-            return plant
-    return None
+    # Filter in the database rather than loading every plant and scanning in Python
+    return db.query(Plant).filter(
+        func.lower(Plant.name) == plant_name.lower()
+    ).order_by(Plant.id).first()
+
+
+def _weight_range(row: dict) -> str:
+    """Describe a classification's weight range for the seeding output."""
+    if row["min_weight"] is None and row["max_weight"] is None:
+        return "catch-all"
+    if row["max_weight"] is None:
+        return f"{row['min_weight']} and up"
+    if row["min_weight"] is None:
+        return f"{row['max_weight']} and below"
+    return f"{row['min_weight']}-{row['max_weight']}"
 
 
 def seed_weight_classes_for_plant(db: Session, plant_name: str) -> dict:
@@ -68,119 +75,70 @@ def seed_weight_classes_for_plant(db: Session, plant_name: str) -> dict:
     
     print(f"Found plant: {plant.name} (ID: {plant.id})")
     
-    # Get existing weight classifications for this plant
-    existing_wcs = weight_classification_crud.get_weight_classifications_by_plant(db, plant.id)
-    existing_classifications = {wc.classification for wc in existing_wcs}
+    # Load the (category, classification) pairs this plant already has in one query
+    existing_pairs = set(
+        db.query(WeightClassification.category, WeightClassification.classification)
+        .filter(WeightClassification.plant_id == plant.id)
+        .all()
+    )
     
-    created_dressed = 0
-    created_frozen = 0
-    created_byproduct = 0
-    skipped_dressed = 0
-    skipped_frozen = 0
-    skipped_byproduct = 0
+    templates = {
+        "Dressed": DRESSED_CLASSIFICATIONS,
+        "Frozen": DRESSED_CLASSIFICATIONS,  # Frozen uses the same ranges as Dressed
+        "Byproduct": BYPRODUCT_CLASSIFICATIONS,
+    }
+    rows = []
+    skipped = {category: 0 for category in templates}
     errors = []
     
-    # Create Dressed classifications
-    print(f"\nSeeding Dressed classifications for {plant.name}...")
-    for dc in DRESSED_CLASSIFICATIONS:
-        if dc["classification"] in existing_classifications:
-            print(f"  ⊘ Skipped (already exists): {dc['classification']}")
-            skipped_dressed += 1
-            continue
-        
-        try:
-            wc = weight_classification_crud.create_weight_classification(
-                db,
-                WeightClassificationCreate(
-                    plant_id=plant.id,
-                    classification=dc["classification"],
-                    min_weight=dc["min_weight"],
-                    max_weight=dc["max_weight"],
-                    description=dc["description"],
-                    category="Dressed"
-                )
-            )
-            weight_range = (
-                "catch-all" if (dc["min_weight"] is None and dc["max_weight"] is None)
-                else f"{dc['min_weight']} and up" if dc["max_weight"] is None
-                else f"{dc['max_weight']} and below" if dc["min_weight"] is None
-                else f"{dc['min_weight']}-{dc['max_weight']}"
-            )
-            print(f"  ✓ Created: {wc.classification} ({weight_range})")
-            created_dressed += 1
-        except Exception as e:
-            error_msg = f"  ✗ Failed to create {dc['classification']}: {str(e)}"
-            print(error_msg)
-            errors.append(error_msg)
+    for category, classifications in templates.items():
+        for template in classifications:
+            label = template["classification"]
+            if category == "Byproduct":
+                label = f"{label} ({template['description']})"
+            if (category, template["classification"]) in existing_pairs:
+                print(f"  ⊘ Skipped {category} (already exists): {label}")
+                skipped[category] += 1
+                continue
+            rows.append({
+                "plant_id": plant.id,
+                "classification": template["classification"],
+                "min_weight": template.get("min_weight"),
+                "max_weight": template.get("max_weight"),
+                "description": template["description"],
+                "category": category,
+            })
     
-    # Create Frozen classifications (same as Dressed)
-    print(f"\nSeeding Frozen classifications for {plant.name}...")
-    existing_frozen = {wc.classification for wc in existing_wcs if wc.category == "Frozen"}
-    for dc in DRESSED_CLASSIFICATIONS:
-        if dc["classification"] in existing_frozen:
-            print(f"  ⊘ Skipped (already exists): {dc['classification']}")
-            skipped_frozen += 1
-            continue
-        
+    # The templates don't overlap, so every missing row goes in as one INSERT and one commit
+    if rows:
+        print(f"\nSeeding {len(rows)} weight classifications for {plant.name}...")
         try:
-            wc = weight_classification_crud.create_weight_classification(
-                db,
-                WeightClassificationCreate(
-                    plant_id=plant.id,
-                    classification=dc["classification"],
-                    min_weight=dc["min_weight"],
-                    max_weight=dc["max_weight"],
-                    description=dc["description"],
-                    category="Frozen"
-                )
-            )
-            weight_range = (
-                "catch-all" if (dc["min_weight"] is None and dc["max_weight"] is None)
-                else f"{dc['min_weight']} and up" if dc["max_weight"] is None
-                else f"{dc['max_weight']} and below" if dc["min_weight"] is None
-                else f"{dc['min_weight']}-{dc['max_weight']}"
-            )
-            print(f"  ✓ Created: {wc.classification} ({weight_range})")
-            created_frozen += 1
+            db.execute(insert(WeightClassification), rows)
+            db.commit()
         except Exception as e:
-            error_msg = f"  ✗ Failed to create {dc['classification']}: {str(e)}"
+            db.rollback()
+            error_msg = f"  ✗ Failed to create weight classifications: {str(e)}"
             print(error_msg)
             errors.append(error_msg)
+            rows = []
     
-    # Create Byproduct classifications
-    print(f"\nSeeding Byproduct classifications for {plant.name}...")
-    for bp in BYPRODUCT_CLASSIFICATIONS:
-        if bp["classification"] in existing_classifications:
-            print(f"  ⊘ Skipped (already exists): {bp['classification']} ({bp['description']})")
-            skipped_byproduct += 1
-            continue
-        
-        try:
-            wc = weight_classification_crud.create_weight_classification(
-                db,
-                WeightClassificationCreate(
-                    plant_id=plant.id,
-                    classification=bp["classification"],
-                    description=bp["description"],
-                    min_weight=None,
-                    max_weight=None,
-                    category="Byproduct"
-                )
-            )
-            print(f"  ✓ Created: {wc.classification} ({wc.description})")
-            created_byproduct += 1
-        except Exception as e:
-            error_msg = f"  ✗ Failed to create {bp['classification']}: {str(e)}"
-            print(error_msg)
-            errors.append(error_msg)
+    for row in rows:
+        if row["category"] == "Byproduct":
+            print(f"  ✓ Created Byproduct: {row['classification']} ({row['description']})")
+        else:
+            print(f"  ✓ Created {row['category']}: {row['classification']} ({_weight_range(row)})")
+    
+    created = {category: 0 for category in templates}
+    for row in rows:
+        created[row["category"]] += 1
     
     return {
-        "created_dressed": created_dressed,
-        "created_frozen": created_frozen,
-        "created_byproduct": created_byproduct,
-        "skipped_dressed": skipped_dressed,
-        "skipped_frozen": skipped_frozen,
-        "skipped_byproduct": skipped_byproduct,
+        "created_dressed": created["Dressed"],
+        "created_frozen": created["Frozen"],
+        "created_byproduct": created["Byproduct"],
+        "skipped_dressed": skipped["Dressed"],
+        "skipped_frozen": skipped["Frozen"],
+        "skipped_byproduct": skipped["Byproduct"],
         "errors": errors
     }
 
@@ -206,7 +164,7 @@ def main():
     try:
         # Create tables if they don't exist
         print("Ensuring database tables exist...")
-        Base.metadata.create_all(bind=engine)
+        create_missing_tables()
         print("✓ Database tables ready\n")
         
         # Create database session
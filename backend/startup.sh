@@ -18,6 +18,8 @@ alembic upgrade head
 echo "Ensuring default admin user exists..."
 python seed_admin.py
 
-# Start the server
+# Start the server (one worker per CPU unless WEB_CONCURRENCY is set).
+# Exported so each worker can size its share of the DB connection pool.
+export WEB_CONCURRENCY=${WEB_CONCURRENCY:-$(nproc)}
 echo "Starting FastAPI server..."
-uvicorn app.main:app --host 0.0.0.0 --port 8000
+uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --workers $WEB_CONCURRENCY
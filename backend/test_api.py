@@ -2,26 +2,84 @@
 Simple script to test the API endpoints
 Run this after starting the backend server
 """
+import os
+import threading
+from datetime import date
 import requests
-import json
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:8000/api/v1"
+# Ceiling on in-flight requests for the concurrent steps, in case the server is rate limited
+MAX_CONCURRENCY = max(1, int(os.getenv("TEST_CONCURRENCY", "4")))
+TODAY = date.today().isoformat()
+# Transient gateway errors are retried for reads only, since a retried create could insert twice;
+# connection failures are retried for every method because the request never reached the server
+RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], allowed_methods=frozenset(["GET"]))
 
-def test_endpoints():
+# requests.Session isn't thread-safe, so each thread (main and executor workers) keeps its own
+_local = threading.local()
+_sessions = []
+_sessions_lock = threading.Lock()
+
+
+def _session() -> requests.Session:
+    """Return this thread's HTTP session, creating it on first use so its keep-alive connections are reused."""
+    http = getattr(_local, "http", None)
+    if http is None:
+        http = requests.Session()
+        # Bodies are pre-encoded with orjson and sent as data=, so set the type once here
+        http.headers["Content-Type"] = "application/json"
+        http.mount("http://", HTTPAdapter(max_retries=RETRY))
+        _local.http = http
+        with _sessions_lock:
+            _sessions.append(http)
+    return http
+
+
+def _get(url: str, **kwargs) -> requests.Response:
+    return _session().get(url, **kwargs)
+
+
+def _post(url: str, **kwargs) -> requests.Response:
+    return _session().post(url, **kwargs)
+
+
+def close_sessions() -> None:
+    """Close every per-thread session opened by _session()."""
+    with _sessions_lock:
+        while _sessions:
+            _sessions.pop().close()
+
+
+def run_smoke_test():
+    """
+    Run through the API against a live server.
+    JSON bodies are encoded and decoded with orjson, the same library the server responds with.
+    """
     print("🚀 Testing Tally System API\n")
     
     # Test 1: Health check
     print("1. Testing health endpoint...")
-    response = requests.get("http://localhost:8000/health")
+    response = _get("http://localhost:8000/health")
     print(f"   Status: {response.status_code}")
-    print(f"   Response: {response.json()}\n")
+    print(f"   Response: {orjson.loads(response.content)}\n")
+    
+    # Steps 2 and 3 don't depend on each other, so send both creates at once
+    customer_data = {"name": "Test Customer API"}
+    plant_data = {"name": "Test Plant API"}
+    with ThreadPoolExecutor(max_workers=min(2, MAX_CONCURRENCY)) as executor:
+        customer_future = executor.submit(_post, f"{BASE_URL}/customers", data=orjson.dumps(customer_data))
+        plant_future = executor.submit(_post, f"{BASE_URL}/plants", data=orjson.dumps(plant_data))
+        customer_response, plant_response = customer_future.result(), plant_future.result()
     
     # Test 2: Create Customer
     print("2. Creating customer...")
-    customer_data = {"name": "Test Customer API"}
-    response = requests.post(f"{BASE_URL}/customers", json=customer_data)
+    response = customer_response
     if response.status_code == 201:
-        customer = response.json()
+        customer = orjson.loads(response.content)
         customer_id = customer["id"]
         print(f"   ✅ Customer created: ID={customer_id}, Name={customer['name']}\n")
     else:
@@ -30,18 +88,17 @@ def test_endpoints():
     
     # Test 3: Create Plant
     print("3. Creating plant...")
-    plant_data = {"name": "Test Plant API"}
-    response = requests.post(f"{BASE_URL}/plants", json=plant_data)
+    response = plant_response
     if response.status_code == 201:
-        plant = response.json()
+        plant = orjson.loads(response.content)
         plant_id = plant["id"]
         print(f"   ✅ Plant created: ID={plant_id}, Name={plant['name']}\n")
     else:
         print(f"   ❌ Error: {response.status_code} - {response.text}\n")
         return
     
-    # Test 4: Create Weight Classification
-    print("4. Creating weight classification...")
+    # The weight classification only needs the plant and the session only needs the
+    # customer and plant, so steps 4 and 5 are sent together as well
     wc_data = {
         "plant_id": plant_id,
         "classification": "Whole Chicken",
@@ -49,9 +106,24 @@ def test_endpoints():
         "max_weight": 3.0,
         "category": "Dressed"
     }
-    response = requests.post(f"{BASE_URL}/plants/{plant_id}/weight-classifications", json=wc_data)
+    session_data = {
+        "customer_id": customer_id,
+        "plant_id": plant_id,
+        "date": TODAY,
+        "status": "ongoing"
+    }
+    with ThreadPoolExecutor(max_workers=min(2, MAX_CONCURRENCY)) as executor:
+        wc_future = executor.submit(
+            _post, f"{BASE_URL}/plants/{plant_id}/weight-classifications", data=orjson.dumps(wc_data)
+        )
+        session_future = executor.submit(_post, f"{BASE_URL}/tally-sessions", data=orjson.dumps(session_data))
+        wc_response, session_response = wc_future.result(), session_future.result()
+    
+    # Test 4: Create Weight Classification
+    print("4. Creating weight classification...")
+    response = wc_response
     if response.status_code == 201:
-        wc = response.json()
+        wc = orjson.loads(response.content)
         wc_id = wc["id"]
         print(f"   ✅ Weight classification created: ID={wc_id}, Classification={wc['classification']}\n")
     else:
@@ -60,16 +132,9 @@ def test_endpoints():
     
     # Test 5: Create Tally Session
     print("5. Creating tally session...")
-    from datetime import date
-    session_data = {
-        "customer_id": customer_id,
-        "plant_id": plant_id,
-        "date": str(date.today()),
-        "status": "ongoing"
-    }
-    response = requests.post(f"{BASE_URL}/tally-sessions", json=session_data)
+    response = session_response
     if response.status_code == 201:
-        session = response.json()
+        session = orjson.loads(response.content)
         session_id = session["id"]
         print(f"   ✅ Tally session created: ID={session_id}, Status={session['status']}\n")
     else:
@@ -85,9 +150,9 @@ def test_endpoints():
         "allocated_bags_tally": 95.0,
         "allocated_bags_dispatcher": 95.0
     }
-    response = requests.post(f"{BASE_URL}/tally-sessions/{session_id}/allocations", json=allocation_data)
+    response = _post(f"{BASE_URL}/tally-sessions/{session_id}/allocations", data=orjson.dumps(allocation_data))
     if response.status_code == 201:
-        allocation = response.json()
+        allocation = orjson.loads(response.content)
         print(f"   ✅ Allocation created: ID={allocation['id']}")
         print(f"      Required: {allocation['required_bags']}, Allocated (Tally): {allocation['allocated_bags_tally']}, Allocated (Dispatcher): {allocation['allocated_bags_dispatcher']}\n")
     else:
@@ -96,10 +161,17 @@ def test_endpoints():
     
     # Test 7: Get all data
     print("7. Retrieving all data...")
-    customers = requests.get(f"{BASE_URL}/customers").json()
-    plants = requests.get(f"{BASE_URL}/plants").json()
-    sessions = requests.get(f"{BASE_URL}/tally-sessions").json()
-    allocations = requests.get(f"{BASE_URL}/tally-sessions/{session_id}/allocations").json()
+    # The four reads are independent, so issue them concurrently instead of one after another
+    urls = [
+        f"{BASE_URL}/customers",
+        f"{BASE_URL}/plants",
+        f"{BASE_URL}/tally-sessions",
+        f"{BASE_URL}/tally-sessions/{session_id}/allocations",
+    ]
+    with ThreadPoolExecutor(max_workers=min(len(urls), MAX_CONCURRENCY)) as executor:
+        customers, plants, sessions, allocations = executor.map(
+            lambda url: orjson.loads(_get(url).content), urls
+        )
     
     print(f"   ✅ Customers: {len(customers)}")
     print(f"   ✅ Plants: {len(plants)}")
@@ -112,11 +184,13 @@ def test_endpoints():
 
 if __name__ == "__main__":
     try:
-        test_endpoints()
+        run_smoke_test()
     except requests.exceptions.ConnectionError:
         print("❌ Error: Cannot connect to API. Make sure the backend server is running:")
         print("   cd backend")
         print("   uvicorn app.main:app --reload")
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        close_sessions()
 